@@ -25,20 +25,164 @@ Author: Thermal Management System
 License: MIT
 """
 
+import atexit
+import http.client
 import json
+import logging
+import math
 import os
 import time
+import urllib.parse
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-import warnings
+from typing import IO, Dict, List, Tuple, Optional
+
+log = logging.getLogger(__name__)
 
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
 except ImportError:
     NUMPY_AVAILABLE = False
-    warnings.warn("NumPy not available. Install with: pip3 install numpy")
+    log.warning("NumPy not available. Install with: pip3 install numpy")
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+    # Prime the CPU utilization reference point so the first
+    # get_power_consumption() call does not have to block for a sample
+    psutil.cpu_percent(interval=None)
+    _CPU_PERCENT_PRIMED_AT = time.monotonic()
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2).encode()
+
+
+def _json_loads(payload: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Directories already created/verified by _ensure_parent_dir()
+_DIRS_ENSURED = set()
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the parent directory of path once per process."""
+    directory = os.path.dirname(path)
+    if directory and directory not in _DIRS_ENSURED:
+        os.makedirs(directory, exist_ok=True)
+        _DIRS_ENSURED.add(directory)
+
+
+def _linear_fit(x, y) -> Tuple[float, float, float, float]:
+    """
+    Closed-form least squares fit of y = slope * x + intercept.
+
+    Solves the 2-parameter normal equations from running sums, so there is
+    no design matrix and no SVD, and derives the residual/total sums of
+    squares from the same sums.
+
+    Args:
+        x: 1-D array of independent variable samples
+        y: 1-D array of dependent variable samples
+
+    Returns:
+        Tuple of (slope, intercept, ss_res, ss_tot)
+
+    Raises:
+        ValueError: If all x samples are identical
+    """
+    # Keep inputs in float64: det and ss_res subtract large, nearly equal
+    # sums, and float32's ~7 digits visibly corrupt ss_res (and thus sigma)
+    # Dot products reduce without materializing x*x / x*y temporaries
+    n = x.size
+    Sx = x.sum()
+    Sxx = np.dot(x, x)
+    Sy = y.sum()
+    Sxy = np.dot(x, y)
+    det = n * Sxx - Sx * Sx
+    if det <= 0:
+        raise ValueError("Cannot fit a line: all independent samples are identical")
+
+    slope = float((n * Sxy - Sx * Sy) / det)
+    intercept = float((Sxx * Sy - Sx * Sxy) / det)
+
+    # The normal equations make the residual cross terms collapse, so no
+    # prediction/error arrays are needed. Clamp rounding noise at 0.
+    Syy = np.dot(y, y)
+    ss_res = max(float(Syy - slope * Sxy - intercept * Sy), 0.0)
+    ss_tot = max(float(Syy - Sy * Sy / n), 0.0)
+
+    return slope, intercept, ss_res, ss_tot
+
+
+def _fit_zones(x, Y):
+    """
+    Closed-form least squares fit of Y[:, z] = slope[z] * x + intercept[z].
+
+    All columns share the same independent variable, so the x sums are
+    computed once and the per-column sums come from a single pass over Y
+    (column sums plus one matrix-vector product) instead of a Python loop
+    over zones.
+
+    Args:
+        x: 1-D array of N independent variable samples
+        Y: (N, Z) array, one dependent variable column per zone
+
+    Returns:
+        Tuple of (slopes, intercepts, ss_res) arrays of length Z
+
+    Raises:
+        ValueError: If all x samples are identical
+    """
+    n = x.size
+    Sx = x.sum()
+    Sxx = x @ x
+    det = n * Sxx - Sx * Sx
+    if det <= 0:
+        raise ValueError("Cannot fit a line: all independent samples are identical")
+
+    Sy = Y.sum(axis=0)
+    Sxy = x @ Y
+    Syy = np.einsum('ij,ij->j', Y, Y)
+
+    slopes = (n * Sxy - Sx * Sy) / det
+    intercepts = (Sxx * Sy - Sx * Sxy) / det
+    ss_res = np.maximum(Syy - slopes * Sxy - intercepts * Sy, 0.0)
+
+    return slopes, intercepts, ss_res
+
+
+# Estimators holding calibration changes not yet written to disk
+_DIRTY_ESTIMATORS = weakref.WeakSet()
+
+
+def _flush_dirty_estimators() -> None:
+    """Write out pending calibration changes at interpreter exit."""
+    for estimator in list(_DIRTY_ESTIMATORS):
+        try:
+            estimator.flush()
+        except OSError as e:
+            log.warning("Failed to save calibration: %s", e)
+
+
+atexit.register(_flush_dirty_estimators)
 
 
 class AmbientTempEstimator:
@@ -52,8 +196,13 @@ class AmbientTempEstimator:
         calibrated (bool): Whether the estimator has been calibrated
         calibration_time (str): Timestamp of last calibration
         n_samples (int): Number of calibration samples used
+        fast_estimate (callable): fast_estimate(T_cpu, P) -> T_amb_est with the
+            current R_th and b bound as constants (None until calibrated)
     """
 
+    # config_file -> ((st_mtime_ns, st_size), parsed document), shared by all instances
+    _CAL_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
     def __init__(self, config_file: str = "/var/lib/thermal-manager/ambient_calibration.json"):
         """
         Initialize the ambient temperature estimator.
@@ -72,28 +221,55 @@ class AmbientTempEstimator:
         # Cold start detection parameters
         self.cold_start_threshold = 300  # 5 minutes offline = cold start
         self.last_shutdown_time = None
+        self.bias_process_noise = 0.01  # Kalman Q: allowed bias drift per update (°C²)
+        self.bias_save_threshold = 0.05  # Persist bias once it moves this far (°C)
+        # Prior bias variance as a fraction of sigma²; 1/9 makes the first
+        # cold start update move the bias 10%, like the old 0.9/0.1 smoothing
+        self.bias_prior_fraction = 1 / 9
+        self._b_var = self.sigma ** 2 * self.bias_prior_fraction  # Kalman variance of the bias estimate
+        self._b_persisted = None  # Bias value last written to disk
+        self.save_min_interval = 30.0  # Minimum seconds between deferred saves
+        self._dirty = False  # Calibration changed since the last save
+        self._last_save = None  # time.monotonic() of the last save
 
         # Cooldown curve parameters
         self.tau = None  # Time constant for exponential decay
 
+        # Specialized estimator, rebuilt whenever R_th or b change
+        self.fast_estimate = None
+
+        # Rolling calibration samples (add_sample), one array per quantity
+        self._T_cpu_buf = None
+        self._P_buf = None
+        self._T_amb_buf = None
+        self._n_buffered = 0
+
         # Ensure config directory exists
-        os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+        _ensure_parent_dir(self.config_file)
 
         # Load existing calibration if available
         self.load_calibration()
 
-    def calibrate(self, samples: List[Tuple[float, float, float]]) -> Dict[str, float]:
+    def calibrate(self, samples: Optional[List[Tuple[float, float, float]]] = None, *,
+                  T_cpu=None, P=None, T_amb=None) -> Dict[str, float]:
         """
         Calibrate the estimator using measured data samples.
 
         Uses linear regression to compute R_th and b from the thermal model:
             T_cpu - T_amb = P * R_th + b
 
+        Samples can be given as rows (``samples``) or, when the caller already
+        holds NumPy history buffers, as three column arrays (``T_cpu``, ``P``,
+        ``T_amb``) which are used without repacking.
+
         Args:
-            samples: List of (T_cpu, P, T_amb_measured) tuples
+            samples: List (or (N, 3) array) of (T_cpu, P, T_amb_measured) rows
                 T_cpu: CPU temperature in °C
                 P: Power consumption in W
                 T_amb_measured: Measured ambient temperature in °C
+            T_cpu: 1-D array of CPU temperatures in °C (instead of samples)
+            P: 1-D array of power consumption values in W (instead of samples)
+            T_amb: 1-D array of measured ambient temperatures in °C (instead of samples)
 
         Returns:
             Dictionary with calibration results:
@@ -110,46 +286,58 @@ class AmbientTempEstimator:
         if not NUMPY_AVAILABLE:
             raise ImportError("NumPy is required for calibration. Install with: pip3 install numpy")
 
-        if len(samples) < 3:
-            raise ValueError(f"Need at least 3 samples for calibration, got {len(samples)}")
-
-        # Extract data
-        T_cpu = np.array([s[0] for s in samples])
-        P = np.array([s[1] for s in samples])
-        T_amb = np.array([s[2] for s in samples])
-
-        # Validate data
-        if np.any(np.isnan(T_cpu)) or np.any(np.isnan(P)) or np.any(np.isnan(T_amb)):
-            raise ValueError("Sample data contains NaN values")
-
-        if np.any(P <= 0):
+        if samples is not None:
+            if len(samples) < 3:
+                raise ValueError(f"Need at least 3 samples for calibration, got {len(samples)}")
+
+            # Extract data (one C-level conversion, columns are views)
+            data = np.asarray(samples, dtype=np.float64)
+            if data.ndim != 2 or data.shape[1] != 3:
+                raise ValueError(f"Samples must be (T_cpu, P, T_amb) triples, got shape {data.shape}")
+            T_cpu, P, T_amb = data[:, 0], data[:, 1], data[:, 2]
+            columns = (data,)
+        elif T_cpu is not None and P is not None and T_amb is not None:
+            T_cpu = np.asarray(T_cpu, dtype=np.float64)
+            P = np.asarray(P, dtype=np.float64)
+            T_amb = np.asarray(T_amb, dtype=np.float64)
+            if T_cpu.ndim != 1 or not T_cpu.shape == P.shape == T_amb.shape:
+                raise ValueError("T_cpu, P and T_amb must be 1-D arrays of equal length")
+            if P.size < 3:
+                raise ValueError(f"Need at least 3 samples for calibration, got {P.size}")
+            columns = (T_cpu, P, T_amb)
+        else:
+            raise ValueError("Provide either samples or all of T_cpu, P and T_amb")
+
+        # Validate data (rows are checked in one sweep over the whole block)
+        for block in columns:
+            if not np.isfinite(block).all():
+                raise ValueError("Sample data contains NaN or infinite values")
+
+        if P.min() <= 0:
             raise ValueError("Power consumption must be positive")
 
         # Compute temperature delta (dependent variable)
         delta_T = T_cpu - T_amb
 
         # Linear regression: delta_T = R_th * P + b
-        # Using least squares: [P, 1] @ [R_th, b] = delta_T
-        X = np.column_stack([P, np.ones(len(P))])
-        coeffs, residuals, rank, s = np.linalg.lstsq(X, delta_T, rcond=None)
-
-        self.R_th = coeffs[0]
-        self.b = coeffs[1]
+        # Results are plain Python floats: estimate() runs every control tick
+        # and NumPy scalar arithmetic there costs ~20x more than float math
+        self.R_th, self.b, ss_res, ss_tot = _linear_fit(P, delta_T)
 
-        # Compute uncertainty (standard error)
-        predictions = X @ coeffs
-        errors = delta_T - predictions
-        self.sigma = np.std(errors)
+        # Compute uncertainty (standard error); residuals have zero mean
+        self.sigma = math.sqrt(ss_res / P.size)
 
         # Compute R² (coefficient of determination)
-        ss_res = np.sum(errors ** 2)
-        ss_tot = np.sum((delta_T - np.mean(delta_T)) ** 2)
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
 
+        # Fresh fit: reset the bias uncertainty to its prior
+        self._b_var = self.sigma ** 2 * self.bias_prior_fraction
+
         # Update metadata
         self.calibrated = True
+        self._specialize_estimate()
         self.calibration_time = datetime.now().isoformat()
-        self.n_samples = len(samples)
+        self.n_samples = int(P.size)
 
         # Save calibration
         self.save_calibration()
@@ -163,6 +351,147 @@ class AmbientTempEstimator:
             'calibration_time': self.calibration_time
         }
 
+    def add_sample(self, T_cpu: float, P: float, T_amb: float) -> None:
+        """
+        Buffer one calibration sample for calibrate_from_buffer().
+
+        Samples are stored in three contiguous float64 arrays that double in
+        size when full, so long collection runs cost 24 bytes per sample
+        and need no conversion when calibrating.
+
+        Args:
+            T_cpu: CPU temperature in °C
+            P: Power consumption in W
+            T_amb: Measured ambient temperature in °C
+
+        Raises:
+            ImportError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for calibration. Install with: pip3 install numpy")
+
+        n = self._n_buffered
+        if self._P_buf is None:
+            self._T_cpu_buf = np.empty(256)
+            self._P_buf = np.empty(256)
+            self._T_amb_buf = np.empty(256)
+        elif n == self._P_buf.size:
+            # Geometric growth keeps appends amortized O(1)
+            for name in ('_T_cpu_buf', '_P_buf', '_T_amb_buf'):
+                old = getattr(self, name)
+                new = np.empty(2 * old.size)
+                new[:n] = old
+                setattr(self, name, new)
+
+        self._T_cpu_buf[n] = T_cpu
+        self._P_buf[n] = P
+        self._T_amb_buf[n] = T_amb
+        self._n_buffered = n + 1
+
+    def clear_samples(self) -> None:
+        """Discard samples buffered by add_sample() (keeps the allocation)."""
+        self._n_buffered = 0
+
+    def calibrate_from_buffer(self) -> Dict[str, float]:
+        """
+        Calibrate from the samples collected with add_sample().
+
+        The buffer is left intact so more samples can be added and the
+        estimator recalibrated; call clear_samples() to start over.
+
+        Returns:
+            Calibration results dictionary (see calibrate())
+
+        Raises:
+            ValueError: If insufficient samples or invalid data
+            ImportError: If NumPy is not available
+        """
+        n = self._n_buffered
+        if n == 0:
+            raise ValueError("Need at least 3 samples for calibration, got 0")
+        return self.calibrate(T_cpu=self._T_cpu_buf[:n], P=self._P_buf[:n],
+                              T_amb=self._T_amb_buf[:n])
+
+    def calibrate_zones(self, T_cpu_zones, P, T_amb) -> Dict[str, List[float]]:
+        """
+        Fit the thermal model independently for several thermal zones.
+
+        Boards with more than one CPU thermal zone heat up differently per
+        zone under the same package power. This fits
+            T_zone - T_amb = P * R_th[zone] + b[zone]
+        for every zone at once. The estimator's own single-zone calibration
+        is left untouched.
+
+        Args:
+            T_cpu_zones: (N, Z) array of zone temperatures in °C, one column per zone
+            P: 1-D array of N power consumption values in W
+            T_amb: 1-D array of N measured ambient temperatures in °C
+
+        Returns:
+            Dictionary with per-zone lists:
+                - R_th: Thermal resistance per zone (°C/W)
+                - b: Bias term per zone (°C)
+                - sigma: Standard error per zone (°C)
+                - n_samples: Number of samples used
+
+        Raises:
+            ValueError: If insufficient samples or invalid data
+            ImportError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for calibration. Install with: pip3 install numpy")
+
+        T_cpu_zones = np.asarray(T_cpu_zones, dtype=np.float64)
+        P = np.asarray(P, dtype=np.float64)
+        T_amb = np.asarray(T_amb, dtype=np.float64)
+        if P.ndim != 1 or T_amb.shape != P.shape:
+            raise ValueError("P and T_amb must be 1-D arrays of equal length")
+        if T_cpu_zones.ndim != 2 or T_cpu_zones.shape[0] != P.size:
+            raise ValueError(f"T_cpu_zones must be ({P.size}, Z), got shape {T_cpu_zones.shape}")
+        if P.size < 3:
+            raise ValueError(f"Need at least 3 samples for calibration, got {P.size}")
+
+        for block in (T_cpu_zones, P, T_amb):
+            if not np.isfinite(block).all():
+                raise ValueError("Sample data contains NaN or infinite values")
+
+        if P.min() <= 0:
+            raise ValueError("Power consumption must be positive")
+
+        # Temperature delta per zone (broadcast ambient across columns)
+        delta_T = T_cpu_zones - T_amb[:, None]
+
+        R_th, b, ss_res = _fit_zones(P, delta_T)
+        sigma = np.sqrt(ss_res / P.size)
+
+        return {
+            'R_th': R_th.tolist(),
+            'b': b.tolist(),
+            'sigma': sigma.tolist(),
+            'n_samples': int(P.size)
+        }
+
+    def _specialize_estimate(self) -> None:
+        """
+        Rebuild fast_estimate() with the current R_th and b as constants.
+
+        Must be called whenever R_th or b change. Binding the coefficients
+        into the closure turns two attribute lookups into local loads, and
+        the returned function skips validation entirely, so hot loops that
+        hold a reference to it pay well under half the cost of estimate().
+        """
+        if not self.calibrated:
+            self.fast_estimate = None
+            return
+
+        R_th = float(self.R_th)
+        b = float(self.b)
+
+        def fast_estimate(T_cpu: float, P: float) -> float:
+            return T_cpu - (P * R_th + b)
+
+        self.fast_estimate = fast_estimate
+
     def estimate(self, T_cpu: float, P: float) -> Tuple[float, float]:
         """
         Estimate ambient temperature from current CPU temp and power consumption.
@@ -182,7 +511,8 @@ class AmbientTempEstimator:
         if not self.calibrated:
             raise ValueError("Estimator must be calibrated before estimation")
 
-        if np.isnan(T_cpu) or np.isnan(P):
+        # x != x is the NaN test without a NumPy ufunc dispatch per call
+        if T_cpu != T_cpu or P != P:
             raise ValueError("Invalid input: T_cpu or P is NaN")
 
         if P < 0:
@@ -193,6 +523,53 @@ class AmbientTempEstimator:
 
         return T_amb_est, self.sigma
 
+    def estimate_batch(self, T_cpu, P, out=None) -> Tuple["np.ndarray", float]:
+        """
+        Estimate ambient temperature for whole arrays of readings at once.
+
+        Vectorized form of estimate() for logged history or sample windows.
+        Lists are accepted and converted once; pass float64 arrays to avoid
+        that copy. A reusable ``out`` buffer makes the call allocation-free.
+
+        Args:
+            T_cpu: Array (or sequence) of CPU temperatures in °C
+            P: Array (or sequence) of power consumption values in W (same shape as T_cpu)
+            out: Optional float64 array to write the estimates into
+
+        Returns:
+            Tuple of (T_amb_est, uncertainty):
+                T_amb_est: Array of estimated ambient temperatures in °C
+                uncertainty: Uncertainty in °C (±σ), shared by all estimates
+
+        Raises:
+            ValueError: If estimator not calibrated or shapes mismatch
+            ImportError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for batch estimation")
+
+        if not self.calibrated:
+            raise ValueError("Estimator must be calibrated before estimation")
+
+        # No-ops for float64 arrays; one C-level conversion for lists
+        T_cpu = np.asarray(T_cpu, dtype=np.float64)
+        P = np.asarray(P, dtype=np.float64)
+
+        if T_cpu.shape != P.shape:
+            raise ValueError(f"T_cpu and P shapes differ: {T_cpu.shape} vs {P.shape}")
+
+        if out is None:
+            out = np.empty(P.shape, dtype=np.float64)
+        elif out.shape != P.shape:
+            raise ValueError(f"Output buffer shape {out.shape} does not match {P.shape}")
+
+        # T_amb = T_cpu - (P * R_th + b), computed in place
+        np.multiply(P, self.R_th, out=out)
+        np.add(out, self.b, out=out)
+        np.subtract(T_cpu, out, out=out)
+
+        return out, self.sigma
+
     def estimate_with_cold_start_correction(self, T_cpu: float, P: float,
                                            uptime_seconds: float) -> Tuple[float, float]:
         """
@@ -210,16 +587,41 @@ class AmbientTempEstimator:
             Tuple of (T_amb_est, uncertainty) in °C
         """
         # Detect cold start (system just booted and very low power/temp)
-        if uptime_seconds < 60 and P < 5:  # First minute, low power
+        if self.calibrated and uptime_seconds < 60 and P < 5:  # First minute, low power
             # Assume CPU temp ≈ ambient during cold start
             # Update bias: b = T_cpu - T_amb, but T_amb ≈ T_cpu at startup
             # So we can adjust b to minimize initial offset
             cold_start_bias = P * self.R_th  # Expected offset from power alone
-            self.b = self.b * 0.9 + cold_start_bias * 0.1  # Gradual adjustment
-            self.save_calibration()
+
+            # Scalar Kalman update: treat the cold start offset as a noisy
+            # measurement of b (noise = calibration residual variance)
+            measurement_var = max(self.sigma ** 2, 1e-6)
+            gain = self._b_var / (self._b_var + measurement_var)
+            self.b += gain * (cold_start_bias - self.b)
+            self._b_var = (1 - gain) * self._b_var + self.bias_process_noise
+            self._specialize_estimate()
+
+            # Only touch the disk once the bias has moved noticeably, and
+            # then at most once per save_min_interval (rest flushed at exit)
+            if self._b_persisted is None or abs(self.b - self._b_persisted) > self.bias_save_threshold:
+                self._dirty = True
+                _DIRTY_ESTIMATORS.add(self)
+            self._maybe_save()
 
         return self.estimate(T_cpu, P)
 
+    def _maybe_save(self) -> None:
+        """Save pending changes unless the last save was too recent."""
+        if not self._dirty:
+            return
+        if self._last_save is None or time.monotonic() - self._last_save >= self.save_min_interval:
+            self.save_calibration()
+
+    def flush(self) -> None:
+        """Write pending calibration changes to disk now."""
+        if self._dirty:
+            self.save_calibration()
+
     def fit_cooldown_curve(self, time_series: List[Tuple[float, float]],
                           T_amb_measured: float) -> Dict[str, float]:
         """
@@ -232,7 +634,8 @@ class AmbientTempEstimator:
         This method fits τ (time constant) and can recalibrate T_amb.
 
         Args:
-            time_series: List of (time_seconds, T_cpu) measurements during cooldown
+            time_series: List (or (N, 2) array, used without copying) of
+                (time_seconds, T_cpu) measurements during cooldown
             T_amb_measured: Actual measured ambient temperature
 
         Returns:
@@ -252,8 +655,12 @@ class AmbientTempEstimator:
         if len(time_series) < 5:
             raise ValueError(f"Need at least 5 points for curve fitting, got {len(time_series)}")
 
-        t = np.array([x[0] for x in time_series])
-        T = np.array([x[1] for x in time_series])
+        data = np.asarray(time_series, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f"Time series must be (time_seconds, T_cpu) pairs, got shape {data.shape}")
+        if not np.isfinite(data).all():
+            raise ValueError("Time series contains NaN or infinite values")
+        t, T = data[:, 0], data[:, 1]
 
         # Normalize time to start at 0
         t = t - t[0]
@@ -264,20 +671,26 @@ class AmbientTempEstimator:
         if np.any(T <= T_amb_measured):
             raise ValueError("Temperature must be above ambient during cooldown")
 
-        y = np.log(T - T_amb_measured)
+        y = T - T_amb_measured
+        np.log(y, out=y)
 
         # Linear fit: y = a - t/τ, where a = ln(T_0 - T_amb)
-        coeffs = np.polyfit(t, y, 1)
-        slope = coeffs[0]
-        intercept = coeffs[1]
+        slope, intercept, _, _ = _linear_fit(t, y)
+        # Less than ~1e-9 of log-decay over the whole series is rounding noise
+        if slope * t.max() > -1e-9:
+            raise ValueError("Temperature is not decaying")
 
         # Extract parameters
         self.tau = -1.0 / slope  # Time constant
         T_amb_fitted = T_0 - np.exp(intercept)  # Fitted ambient
 
-        # Compute RMSE
-        T_predicted = T_amb_measured + (T_0 - T_amb_measured) * np.exp(-t / self.tau)
-        rmse = np.sqrt(np.mean((T - T_predicted) ** 2))
+        # Compute RMSE (prediction and residual share one scratch buffer)
+        scratch = np.multiply(t, -1.0 / self.tau)
+        np.exp(scratch, out=scratch)
+        np.multiply(scratch, T_0 - T_amb_measured, out=scratch)
+        np.add(scratch, T_amb_measured, out=scratch)
+        np.subtract(T, scratch, out=scratch)
+        rmse = math.sqrt(np.dot(scratch, scratch) / scratch.size)
 
         return {
             'tau': float(self.tau),
@@ -287,6 +700,78 @@ class AmbientTempEstimator:
             'rmse': float(rmse)
         }
 
+    def fit_cooldown_curve_robust(self, time_series: List[Tuple[float, float]]) -> Dict[str, float]:
+        """
+        Fit the cooldown curve without a reference ambient temperature.
+
+        Uses Jacquelin's integral-equation method: integrating
+            T(t) = T_amb + (T₀ - T_amb) * exp(-t/τ)
+        turns the exponential into a relation that is linear in its
+        parameters, T(t) - T(0) = A*t + c*∫T dt with c = -1/τ, so τ follows
+        from one small least-squares solve over the running trapezoidal
+        integral. T_amb and T₀ then come from an ordinary line fit of T
+        against exp(-t/τ). Nothing is iterated and no initial guess or log
+        transform is needed, so readings at or below ambient are fine.
+
+        Args:
+            time_series: List (or (N, 2) array, used without copying) of
+                (time_seconds, T_cpu) measurements during cooldown, ordered by time
+
+        Returns:
+            Dictionary with:
+                - tau: Time constant in seconds
+                - T_amb_fitted: Fitted ambient temperature
+                - T_0: Fitted temperature at t=0
+                - rmse: Root mean square error
+
+        Raises:
+            ValueError: If insufficient data, invalid inputs or no decay
+            ImportError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy required for cooldown curve fitting")
+
+        if len(time_series) < 5:
+            raise ValueError(f"Need at least 5 points for curve fitting, got {len(time_series)}")
+
+        data = np.asarray(time_series, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f"Time series must be (time_seconds, T_cpu) pairs, got shape {data.shape}")
+        if not np.isfinite(data).all():
+            raise ValueError("Time series contains NaN or infinite values")
+        t, T = data[:, 0], data[:, 1]
+
+        # Normalize time to start at 0
+        t = t - t[0]
+        dT = T - T[0]
+
+        # Running trapezoidal integral of T, S[0] = 0
+        S = np.empty_like(T)
+        S[0] = 0.0
+        np.cumsum(0.5 * (T[1:] + T[:-1]) * np.diff(t), out=S[1:])
+
+        # Least squares for dT = A*t + c*S (no intercept: both sides are 0 at t=0)
+        Stt = np.dot(t, t)
+        StS = np.dot(t, S)
+        SSS = np.dot(S, S)
+        det = Stt * SSS - StS * StS
+        if det <= 0:
+            raise ValueError("Cannot fit cooldown curve: degenerate time series")
+        c = (Stt * np.dot(S, dT) - StS * np.dot(t, dT)) / det
+        if c >= 0:
+            raise ValueError("Temperature does not decay exponentially")
+
+        # With τ fixed the model is linear: T = T_amb + (T₀ - T_amb) * exp(-t/τ)
+        self.tau = -1.0 / float(c)
+        amplitude, T_amb_fitted, ss_res, _ = _linear_fit(np.exp(c * t), T)
+
+        return {
+            'tau': float(self.tau),
+            'T_amb_fitted': T_amb_fitted,
+            'T_0': T_amb_fitted + amplitude,
+            'rmse': math.sqrt(ss_res / T.size)
+        }
+
     def save_calibration(self) -> None:
         """Save calibration data to JSON file."""
         data = {
@@ -299,8 +784,19 @@ class AmbientTempEstimator:
             'tau': self.tau
         }
 
-        with open(self.config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Serialize up front and write the whole document in one call
+        payload = _json_dumps(data)
+        _ensure_parent_dir(self.config_file)
+        with open(self.config_file, 'wb') as f:
+            f.write(payload)
+
+        # What we just wrote is what a reload would parse
+        st = os.stat(self.config_file)
+        AmbientTempEstimator._CAL_CACHE[self.config_file] = ((st.st_mtime_ns, st.st_size), data)
+        self._b_persisted = self.b
+        self._dirty = False
+        self._last_save = time.monotonic()
+        _DIRTY_ESTIMATORS.discard(self)
 
     def load_calibration(self) -> bool:
         """
@@ -309,12 +805,21 @@ class AmbientTempEstimator:
         Returns:
             True if calibration loaded successfully, False otherwise
         """
-        if not os.path.exists(self.config_file):
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
             return False
 
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            # Reuse the parsed document while the file is unchanged
+            version = (st.st_mtime_ns, st.st_size)
+            cached = AmbientTempEstimator._CAL_CACHE.get(self.config_file)
+            if cached is not None and cached[0] == version:
+                data = cached[1]
+            else:
+                with open(self.config_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                AmbientTempEstimator._CAL_CACHE[self.config_file] = (version, data)
 
             self.R_th = data.get('R_th')
             self.b = data.get('b')
@@ -323,10 +828,13 @@ class AmbientTempEstimator:
             self.calibration_time = data.get('calibration_time')
             self.n_samples = data.get('n_samples', 0)
             self.tau = data.get('tau')
+            self._b_var = self.sigma ** 2 * self.bias_prior_fraction
+            self._b_persisted = self.b
+            self._specialize_estimate()
 
             return self.calibrated
         except (json.JSONDecodeError, KeyError) as e:
-            warnings.warn(f"Failed to load calibration: {e}")
+            log.warning("Failed to load calibration: %s", e)
             return False
 
     def get_calibration_info(self) -> Dict[str, any]:
@@ -348,6 +856,84 @@ class AmbientTempEstimator:
         }
 
 
+# Open sysfs file descriptors keyed by path. sysfs attributes return fresh
+# data on every read at offset 0, so each file only needs to be opened once.
+_SYSFS_FD_CACHE: Dict[str, int] = {}
+
+
+def _pread_cached(path: str, size: int = 32) -> bytes:
+    """
+    Read a small kernel attribute file through a cached file descriptor.
+
+    sysfs/procfs attributes regenerate their contents on every read at
+    offset 0, so the descriptor is kept open and re-read with pread.
+
+    Args:
+        path: sysfs/procfs file to read (e.g. a thermal zone ``temp`` file)
+        size: Maximum number of bytes to read
+
+    Returns:
+        Raw file contents
+
+    Raises:
+        IOError: If the file cannot be opened or read
+    """
+    fd = _SYSFS_FD_CACHE.get(path)
+    if fd is not None:
+        try:
+            return os.pread(fd, size, 0)
+        except OSError:
+            # Stale descriptor (sensor went away): drop it and reopen below
+            del _SYSFS_FD_CACHE[path]
+            os.close(fd)
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        raw = os.pread(fd, size, 0)
+    except OSError:
+        os.close(fd)
+        raise
+    _SYSFS_FD_CACHE[path] = fd
+    return raw
+
+
+def _read_sysfs_int(path: str) -> int:
+    """
+    Read an integer sysfs attribute through a cached file descriptor.
+
+    Args:
+        path: sysfs file to read (e.g. a thermal zone ``temp`` file)
+
+    Returns:
+        Integer value of the attribute
+
+    Raises:
+        IOError: If the file cannot be opened or read
+        ValueError: If the file does not contain an integer
+    """
+    # int() parses the bytes directly, no decode/strip needed
+    return int(_pread_cached(path))
+
+
+def get_system_uptime() -> float:
+    """
+    Read system uptime from /proc/uptime.
+
+    Returns:
+        Seconds since boot (for estimate_with_cold_start_correction)
+
+    Raises:
+        IOError: If /proc/uptime cannot be read
+    """
+    raw = _pread_cached('/proc/uptime', 64)
+    return float(raw[:raw.index(b' ')])
+
+
+# Resolved sensor paths, found on first use and kept while they stay readable
+_ACPI_TEMP_PATH: Optional[str] = None
+_CPU_TEMP_PATH: Optional[str] = None
+
+
 def get_acpi_ambient_temperature() -> float:
     """
     Read ACPI ambient/case temperature from sysfs.
@@ -361,33 +947,39 @@ def get_acpi_ambient_temperature() -> float:
     Raises:
         IOError: If temperature cannot be read
     """
+    global _ACPI_TEMP_PATH
+
+    if _ACPI_TEMP_PATH is not None:
+        try:
+            return _read_sysfs_int(_ACPI_TEMP_PATH) / 1000.0
+        except (IOError, ValueError):
+            _ACPI_TEMP_PATH = None  # Sensor went away: rediscover
+
     # Try ACPI thermal zones (usually zone0 on most SBCs)
     acpi_zones = [
         ('/sys/class/thermal/thermal_zone0/temp', '/sys/class/thermal/thermal_zone0/type'),
     ]
 
     for temp_path, type_path in acpi_zones:
-        if os.path.exists(temp_path) and os.path.exists(type_path):
-            try:
-                # Check if this is actually an ACPI zone
-                with open(type_path, 'r') as f:
-                    zone_type = f.read().strip().lower()
-
-                if 'acpi' in zone_type:
-                    with open(temp_path, 'r') as f:
-                        temp_millidegrees = int(f.read().strip())
-                        return temp_millidegrees / 1000.0
-            except (IOError, ValueError):
-                continue
-
-    # Fallback: Just read zone0 even if type doesn't say ACPI
-    if os.path.exists('/sys/class/thermal/thermal_zone0/temp'):
         try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                temp_millidegrees = int(f.read().strip())
-                return temp_millidegrees / 1000.0
+            # Check if this is actually an ACPI zone
+            with open(type_path, 'r') as f:
+                zone_type = f.read().strip().lower()
+
+            if 'acpi' in zone_type:
+                value = _read_sysfs_int(temp_path) / 1000.0
+                _ACPI_TEMP_PATH = temp_path
+                return value
         except (IOError, ValueError):
-            pass
+            continue
+
+    # Fallback: Just read zone0 even if type doesn't say ACPI
+    try:
+        value = _read_sysfs_int('/sys/class/thermal/thermal_zone0/temp') / 1000.0
+        _ACPI_TEMP_PATH = '/sys/class/thermal/thermal_zone0/temp'
+        return value
+    except (IOError, ValueError):
+        pass
 
     raise IOError("Could not read ACPI/ambient temperature from thermal zones")
 
@@ -402,6 +994,14 @@ def get_cpu_temperature() -> float:
     Raises:
         IOError: If temperature cannot be read
     """
+    global _CPU_TEMP_PATH
+
+    if _CPU_TEMP_PATH is not None:
+        try:
+            return _read_sysfs_int(_CPU_TEMP_PATH) / 1000.0
+        except (IOError, ValueError):
+            _CPU_TEMP_PATH = None  # Sensor went away: rediscover
+
     # Try common thermal zones for CPU package temp
     cpu_zones = [
         '/sys/class/thermal/thermal_zone1/temp',  # Often CPU on Zima Board
@@ -410,17 +1010,86 @@ def get_cpu_temperature() -> float:
     ]
 
     for zone in cpu_zones:
-        if os.path.exists(zone):
-            try:
-                with open(zone, 'r') as f:
-                    temp_millidegrees = int(f.read().strip())
-                    return temp_millidegrees / 1000.0
-            except (IOError, ValueError):
-                continue
+        try:
+            value = _read_sysfs_int(zone) / 1000.0
+            _CPU_TEMP_PATH = zone
+            return value
+        except (IOError, ValueError):
+            continue
 
     raise IOError("Could not read CPU temperature from any thermal zone")
 
 
+RAPL_ENERGY_PATH = '/sys/class/powercap/intel-rapl/intel-rapl:0/energy_uj'
+RAPL_MAX_ENERGY_PATH = '/sys/class/powercap/intel-rapl/intel-rapl:0/max_energy_range_uj'
+RAPL_MIN_INTERVAL = 0.02  # Shorter deltas are dominated by counter granularity
+RAPL_MAX_INTERVAL = 2.0  # Older deltas average over too long to count as current power
+
+# Last RAPL reading as (energy_uj, monotonic_ns, power_w)
+_RAPL_LAST = None
+
+
+def _read_rapl_power() -> float:
+    """
+    Read package power from the RAPL energy counter.
+
+    Power is the energy delta since the previous call, so periodic callers
+    get a reading without waiting. Only the first call (or one after a long
+    gap) blocks for a 100ms sample to seed the counter.
+
+    Returns:
+        Power consumption in Watts
+
+    Raises:
+        IOError: If the RAPL counter cannot be read
+        ValueError: If the counter content is invalid
+    """
+    global _RAPL_LAST
+
+    energy = _read_sysfs_int(RAPL_ENERGY_PATH)
+    now = time.monotonic_ns()
+
+    if _RAPL_LAST is not None:
+        last_energy, last_ns, last_power = _RAPL_LAST
+        elapsed = (now - last_ns) / 1e9
+
+        if elapsed < RAPL_MIN_INTERVAL:
+            # Too soon for a meaningful delta; keep the reference point
+            return last_power
+
+        if elapsed <= RAPL_MAX_INTERVAL:
+            delta_uj = energy - last_energy
+            if delta_uj < 0:
+                # Counter wrapped around
+                delta_uj += _read_sysfs_int(RAPL_MAX_ENERGY_PATH)
+            power_w = delta_uj / 1_000_000.0 / elapsed
+            _RAPL_LAST = (energy, now, power_w)
+            return power_w
+
+    # No usable previous reading: take a short blocking sample
+    time.sleep(0.1)  # 100ms sample
+    energy_2 = _read_sysfs_int(RAPL_ENERGY_PATH)
+    now_2 = time.monotonic_ns()
+
+    delta_uj = energy_2 - energy
+    if delta_uj < 0:
+        delta_uj += _read_sysfs_int(RAPL_MAX_ENERGY_PATH)
+    power_w = delta_uj / 1_000_000.0 / ((now_2 - now) / 1e9)
+    _RAPL_LAST = (energy_2, now_2, power_w)
+    return power_w
+
+
+# Minimum interval for a meaningful cpu_percent() delta
+CPU_PERCENT_MIN_INTERVAL = 0.1
+
+# Typical ZimaBoard/SBC power profile:
+# - Idle: ~6-8W
+# - Load: ~18-24W
+IDLE_POWER = 7.0
+MAX_POWER = 22.0
+_POWER_SLOPE = (MAX_POWER - IDLE_POWER) / 100.0  # W per % CPU utilization
+
+
 def get_power_consumption() -> float:
     """
     Estimate system power consumption.
@@ -430,44 +1099,29 @@ def get_power_consumption() -> float:
     2. RAPL energy interface (Intel/AMD)
     3. Hardcoded estimate based on typical SBC power draw
 
+    Methods 1 and 2 report the average since the previous call. psutil is
+    primed at import, so a call only waits if it comes within
+    CPU_PERCENT_MIN_INTERVAL of module import.
+
     Returns:
         Estimated power consumption in Watts
     """
-    try:
-        # Method 1: Use psutil for CPU utilization-based estimate
-        import psutil
-        cpu_percent = psutil.cpu_percent(interval=1)
-
-        # Typical ZimaBoard/SBC power profile:
-        # - Idle: ~6-8W
-        # - Load: ~18-24W
-        idle_power = 7.0
-        max_power = 22.0
-        estimated_power = idle_power + (max_power - idle_power) * (cpu_percent / 100.0)
+    global _CPU_PERCENT_PRIMED_AT
 
-        return estimated_power
-
-    except ImportError:
-        pass
+    if PSUTIL_AVAILABLE:
+        # Method 1: Use psutil for CPU utilization-based estimate
+        if _CPU_PERCENT_PRIMED_AT is not None:
+            # First call: make sure the delta since priming is long enough
+            remaining = _CPU_PERCENT_PRIMED_AT + CPU_PERCENT_MIN_INTERVAL - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            _CPU_PERCENT_PRIMED_AT = None
+        return IDLE_POWER + _POWER_SLOPE * psutil.cpu_percent(interval=None)
 
     try:
         # Method 2: Try RAPL interface (Intel Running Average Power Limit)
-        rapl_path = '/sys/class/powercap/intel-rapl/intel-rapl:0/energy_uj'
-        if os.path.exists(rapl_path):
-            # Read energy counter (microjoules)
-            with open(rapl_path, 'r') as f:
-                energy_1 = int(f.read().strip())
-
-            time.sleep(0.1)  # 100ms sample
-
-            with open(rapl_path, 'r') as f:
-                energy_2 = int(f.read().strip())
-
-            # Power = ΔE / Δt
-            delta_energy_j = (energy_2 - energy_1) / 1_000_000.0
-            power_w = delta_energy_j / 0.1
-
-            return power_w
+        # Power = ΔE / Δt across successive calls
+        return _read_rapl_power()
 
     except (IOError, ValueError):
         pass
@@ -477,11 +1131,162 @@ def get_power_consumption() -> float:
     return 12.0
 
 
+# Kept-alive HTTPS connections keyed by host, reused across weather lookups
+_HTTPS_CONNECTIONS: Dict[str, http.client.HTTPSConnection] = {}
+
+# Errors from reusing a connection the server has already closed
+# (RemoteDisconnected is a ConnectionResetError, listed for clarity)
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def _https_get(url: str, headers: Dict[str, str], timeout: float = 10,
+               max_redirects: int = 3) -> bytes:
+    """
+    Fetch an HTTPS URL over a persistent connection to its host.
+
+    Reusing the connection skips the TCP and TLS handshakes on repeat
+    lookups. A connection the server has since closed is replaced once;
+    other connection errors are raised straight away. Redirects to
+    another https:// URL are followed, as urlopen() did.
+
+    Args:
+        url: Absolute https:// URL
+        headers: Request headers
+        timeout: Socket timeout in seconds
+        max_redirects: Redirect hops still allowed
+
+    Returns:
+        Response body bytes
+
+    Raises:
+        IOError: On connection failure or a non-200 response
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    for attempt in range(2):
+        conn = _HTTPS_CONNECTIONS.get(parts.netloc)
+        if conn is None:
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout)
+            _HTTPS_CONNECTIONS[parts.netloc] = conn
+
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            del _HTTPS_CONNECTIONS[parts.netloc]
+            # Only a kept-alive connection the server dropped is worth a
+            # second try; timeouts and refused connections fail at once
+            if attempt or not isinstance(e, _STALE_CONNECTION_ERRORS):
+                raise IOError(f"Request to {parts.netloc} failed: {e}") from e
+            continue
+
+        if response.status in _REDIRECT_STATUSES and max_redirects > 0:
+            location = response.getheader('Location')
+            if location:
+                target = urllib.parse.urljoin(url, location)
+                if urllib.parse.urlsplit(target).scheme == 'https':
+                    return _https_get(target, headers, timeout, max_redirects - 1)
+
+        if response.status != 200:
+            raise IOError(f"HTTP {response.status} from {parts.netloc}")
+        return body
+
+
+WEATHER_CACHE_TTL = 600  # Seconds a weather reading is reused without a new request
+WEATHER_CACHE_FILE = '/var/cache/thermal-manager/weather.json'
+
+# (lat, lon) rounded to 2 decimals -> (temperature_celsius, source_name, unix_time)
+_WX_CACHE: Dict[Tuple, Tuple[float, str, float]] = {}
+_WX_CACHE_LOADED = False
+
+
+def _weather_cache_key(latitude: Optional[float], longitude: Optional[float]) -> Tuple:
+    """Cache key for a location (~1 km grid); (None, None) for IP-based lookups."""
+    if latitude is None or longitude is None:
+        return (None, None)
+    return (round(latitude, 2), round(longitude, 2))
+
+
+def _load_weather_cache() -> None:
+    """Merge the on-disk weather cache into _WX_CACHE once per process."""
+    global _WX_CACHE_LOADED
+    if _WX_CACHE_LOADED:
+        return
+    _WX_CACHE_LOADED = True
+    try:
+        with open(WEATHER_CACHE_FILE, 'rb') as f:
+            entries = _json_loads(f.read())
+        for lat, lon, temp_c, source, ts in entries:
+            _WX_CACHE.setdefault((lat, lon), (temp_c, source, ts))
+    except (OSError, ValueError, TypeError):
+        pass  # Missing or unreadable cache is the same as an empty one
+
+
+def _save_weather_cache() -> None:
+    """Mirror _WX_CACHE to disk so a reboot within the TTL reuses it."""
+    entries = [[lat, lon, temp_c, source, ts]
+               for (lat, lon), (temp_c, source, ts) in _WX_CACHE.items()]
+    try:
+        _ensure_parent_dir(WEATHER_CACHE_FILE)
+        with open(WEATHER_CACHE_FILE, 'wb') as f:
+            f.write(_json_dumps(entries))
+    except OSError:
+        pass  # Not fatal (e.g. not running as root); the memory cache still works
+
+
 def get_weather_ambient_temperature(latitude: float = None, longitude: float = None,
                                    api_key: str = None) -> Tuple[float, str]:
     """
     Get ambient temperature from weather API.
 
+    Readings are cached per location for WEATHER_CACHE_TTL seconds in memory
+    and in WEATHER_CACHE_FILE. If every service fails, the last cached
+    reading for the location is returned even when stale.
+
+    Args:
+        latitude: Location latitude (optional for some services)
+        longitude: Location longitude (optional for some services)
+        api_key: OpenWeatherMap API key (optional)
+
+    Returns:
+        Tuple of (temperature_celsius, source_name)
+
+    Raises:
+        IOError: If unable to fetch weather data and nothing is cached
+    """
+    _load_weather_cache()
+    key = _weather_cache_key(latitude, longitude)
+    cached = _WX_CACHE.get(key)
+    now = time.time()
+    if cached is not None and 0 <= now - cached[2] < WEATHER_CACHE_TTL:
+        return cached[0], cached[1]
+
+    try:
+        temp_c, source = _fetch_weather_ambient_temperature(latitude, longitude, api_key)
+    except IOError:
+        if cached is None:
+            raise
+        log.warning("Weather services unreachable, using cached reading from %.0fs ago",
+                    now - cached[2])
+        return cached[0], cached[1]
+
+    _WX_CACHE[key] = (temp_c, source, now)
+    _save_weather_cache()
+    return temp_c, source
+
+
+def _fetch_weather_ambient_temperature(latitude: float = None, longitude: float = None,
+                                       api_key: str = None) -> Tuple[float, str]:
+    """
+    Fetch ambient temperature from weather API, bypassing the cache.
+
     Tries multiple free weather services in order:
     1. weather.gov (US only, no API key needed)
     2. OpenWeatherMap (requires free API key)
@@ -498,52 +1303,43 @@ def get_weather_ambient_temperature(latitude: float = None, longitude: float = N
     Raises:
         IOError: If unable to fetch weather data from any source
     """
-    import urllib.request
-    import urllib.error
+    headers = {'User-Agent': 'ThermalManagementSystem/1.0'}
 
     # Method 1: weather.gov (NOAA, US only, no API key)
     if latitude is not None and longitude is not None:
         try:
             # Get grid point
             url = f"https://api.weather.gov/points/{latitude:.4f},{longitude:.4f}"
-            headers = {'User-Agent': 'ThermalManagementSystem/1.0'}
-            req = urllib.request.Request(url, headers=headers)
-
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                forecast_url = data['properties']['forecastHourly']
-
-            # Get current temperature
-            req = urllib.request.Request(forecast_url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                temp_f = data['properties']['periods'][0]['temperature']
-                temp_c = (temp_f - 32) * 5/9
-                return temp_c, "weather.gov"
-        except (urllib.error.URLError, KeyError, IndexError, ValueError):
+            data = _json_loads(_https_get(url, headers))
+            forecast_url = data['properties']['forecastHourly']
+
+            # Get current temperature (same host, same connection)
+            data = _json_loads(_https_get(forecast_url, headers))
+            temp_f = data['properties']['periods'][0]['temperature']
+            temp_c = (temp_f - 32) * 5/9
+            return temp_c, "weather.gov"
+        except (IOError, KeyError, IndexError, ValueError):
             pass  # Try next method
 
     # Method 2: OpenWeatherMap (requires API key)
     if api_key and latitude is not None and longitude is not None:
         try:
             url = f"https://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={api_key}&units=metric"
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                temp_c = data['main']['temp']
-                return temp_c, "OpenWeatherMap"
-        except (urllib.error.URLError, KeyError, ValueError):
+            data = _json_loads(_https_get(url, headers))
+            temp_c = data['main']['temp']
+            return temp_c, "OpenWeatherMap"
+        except (IOError, KeyError, ValueError):
             pass  # Try next method
 
     # Method 3: wttr.in (IP-based geolocation, no config needed)
     try:
         url = "https://wttr.in/?format=%t"
-        with urllib.request.urlopen(url, timeout=10) as response:
-            temp_str = response.read().decode().strip()
-            # Parse formats like "+15°C" or "-2°C"
-            temp_str = temp_str.replace('°C', '').replace('°F', '').replace('+', '').strip()
-            temp_c = float(temp_str)
-            return temp_c, "wttr.in"
-    except (urllib.error.URLError, ValueError):
+        temp_str = _https_get(url, headers).decode().strip()
+        # Parse formats like "+15°C" or "-2°C"
+        temp_str = temp_str.replace('°C', '').replace('°F', '').replace('+', '').strip()
+        temp_c = float(temp_str)
+        return temp_c, "wttr.in"
+    except (IOError, ValueError):
         pass
 
     raise IOError("Unable to fetch weather data from any source")
@@ -583,6 +1379,7 @@ def auto_calibrate_with_stress(estimator: AmbientTempEstimator,
         ImportError: If required modules not available
         IOError: If cannot read sensors or ambient source
     """
+    import signal
     import subprocess
     import multiprocessing
 
@@ -626,89 +1423,120 @@ def auto_calibrate_with_stress(estimator: AmbientTempEstimator,
         print(f"\nNote: Ambient temperature is assumed constant during calibration.")
         print(f"      For best results, run indoors or in stable conditions.")
 
-    samples = []
     cpu_count = multiprocessing.cpu_count()
 
     # Define load levels (0%, 25%, 50%, 75%, 100%, and some in between)
     load_levels = [0.0, 0.15, 0.30, 0.50, 0.70, 0.85, 1.0, 0.40][:num_samples]
 
+    # Sample buffers (one column per measured quantity)
+    T_cpu_samples = np.empty(len(load_levels))
+    P_samples = np.empty(len(load_levels))
+    n_collected = 0
+
     for i, load in enumerate(load_levels):
         if verbose:
             print(f"\n--- Sample {i+1}/{num_samples}: CPU load {int(load*100)}% ---")
 
-        # Apply CPU load using stress-ng or yes command
+        # Wait for thermal stabilization (3 minutes)
+        stabilization_time = 180  # 3 minutes
+
+        # Apply CPU load using stress-ng or yes command. The load generator
+        # times itself out shortly after the sensors are read; it runs in its
+        # own process group so an interrupt can stop all of its workers.
+        load_duration = stabilization_time + 5
         stress_process = None
         if load > 0:
             try:
                 # Try stress-ng first
                 cpu_workers = max(1, int(cpu_count * load))
                 stress_process = subprocess.Popen(
-                    ['stress-ng', '--cpu', str(cpu_workers), '--quiet'],
+                    ['stress-ng', '--cpu', str(cpu_workers),
+                     '--timeout', f'{load_duration}s', '--quiet'],
                     stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
                 )
                 if verbose:
                     print(f"  Applying load with stress-ng ({cpu_workers} workers)...")
             except FileNotFoundError:
-                # Fallback to yes > /dev/null
+                # Fallback to yes > /dev/null, bounded by coreutils timeout
+                # (--foreground keeps timeout and yes in the shell's group)
                 stress_process = subprocess.Popen(
-                    f"yes > /dev/null & " * int(cpu_count * load),
+                    f"timeout --foreground {load_duration} yes > /dev/null & " * int(cpu_count * load) + "wait",
                     shell=True,
                     stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
                 )
                 if verbose:
                     print(f"  Applying load with shell command...")
 
-        # Wait for thermal stabilization (3 minutes)
-        stabilization_time = 180  # 3 minutes
-        if verbose:
-            print(f"  Waiting {stabilization_time}s for thermal stabilization...")
-
-        for t in range(stabilization_time):
-            time.sleep(1)
-            if verbose and t % 30 == 0 and t > 0:
-                try:
-                    T_cpu_current = get_cpu_temperature()
-                    print(f"    {t}s: CPU temp = {T_cpu_current:.1f}°C")
-                except:
-                    pass
-
-        # Read sensors
         try:
-            T_cpu = get_cpu_temperature()
-            P = get_power_consumption()
-
-            samples.append((T_cpu, P, T_amb_ref))
-
             if verbose:
-                print(f"  ✓ Sample recorded: T_cpu={T_cpu:.2f}°C, P={P:.2f}W, T_amb={T_amb_ref:.2f}°C")
+                print(f"  Waiting {stabilization_time}s for thermal stabilization...")
 
-        except Exception as e:
+            # Sleep straight to each 30s progress checkpoint, then to the deadline,
+            # instead of waking up every second
+            wait_start = time.monotonic()
             if verbose:
-                print(f"  ✗ Error reading sensors: {e}")
-
-        # Stop stress process
-        if stress_process:
-            stress_process.terminate()
+                for checkpoint in range(30, stabilization_time, 30):
+                    time.sleep(max(0.0, wait_start + checkpoint - time.monotonic()))
+                    try:
+                        T_cpu_current = get_cpu_temperature()
+                        print(f"    {checkpoint}s: CPU temp = {T_cpu_current:.1f}°C")
+                    except IOError:
+                        pass
+            time.sleep(max(0.0, wait_start + stabilization_time - time.monotonic()))
+
+            # Read sensors
             try:
-                stress_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                stress_process.kill()
+                T_cpu = get_cpu_temperature()
+                P = get_power_consumption()
+
+                T_cpu_samples[n_collected] = T_cpu
+                P_samples[n_collected] = P
+                n_collected += 1
+
+                if verbose:
+                    print(f"  ✓ Sample recorded: T_cpu={T_cpu:.2f}°C, P={P:.2f}W, T_amb={T_amb_ref:.2f}°C")
+
+            except Exception as e:
+                if verbose:
+                    print(f"  ✗ Error reading sensors: {e}")
 
-            # Also kill any lingering yes processes
-            subprocess.run(['pkill', '-9', 'yes'], stderr=subprocess.DEVNULL)
+            # Let the load generator run out its own timeout
+            if stress_process:
+                try:
+                    stress_process.wait(timeout=load_duration)
+                except subprocess.TimeoutExpired:
+                    pass
+        finally:
+            # Only reached with a live process on interrupt or a hung generator.
+            # Signal the whole group: terminating the shell alone would leave
+            # its `yes` children loading every core until their timeout.
+            if stress_process and stress_process.poll() is None:
+                try:
+                    os.killpg(stress_process.pid, signal.SIGTERM)
+                    try:
+                        stress_process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        os.killpg(stress_process.pid, signal.SIGKILL)
+                        stress_process.wait()
+                except ProcessLookupError:
+                    pass
 
     # Perform calibration
-    if len(samples) < 3:
-        raise ValueError(f"Only collected {len(samples)} samples, need at least 3")
+    if n_collected < 3:
+        raise ValueError(f"Only collected {n_collected} samples, need at least 3")
 
     if verbose:
         print(f"\n{'='*70}")
-        print(f"Performing calibration with {len(samples)} samples...")
+        print(f"Performing calibration with {n_collected} samples...")
         print(f"{'='*70}")
 
-    results = estimator.calibrate(samples)
+    results = estimator.calibrate(T_cpu=T_cpu_samples[:n_collected],
+                                  P=P_samples[:n_collected],
+                                  T_amb=np.full(n_collected, T_amb_ref))
 
     if verbose:
         print(f"\n✓ Auto-calibration successful!")
@@ -722,26 +1550,84 @@ def auto_calibrate_with_stress(estimator: AmbientTempEstimator,
     return results
 
 
+# Open estimation log handles keyed by path (closed at exit)
+_LOG_HANDLES: Dict[str, IO[str]] = {}
+
+# Seconds between checks that a kept-open log is still the file at its path
+LOG_REOPEN_CHECK_INTERVAL = 5.0
+# log_file -> time.monotonic() of its next rotation check
+_LOG_NEXT_CHECK: Dict[str, float] = {}
+
+# Last formatted log timestamp, reused while the wall-clock second is unchanged
+_LOG_TS_SECOND = -1
+_LOG_TS_TEXT = ""
+
+
+def _close_log_handles() -> None:
+    """Close all open estimation log files."""
+    for handle in _LOG_HANDLES.values():
+        handle.close()
+    _LOG_HANDLES.clear()
+    _LOG_NEXT_CHECK.clear()
+
+
+def _log_file_replaced(handle: IO[str], log_file: str) -> bool:
+    """True if log_file was rotated or deleted since handle was opened."""
+    try:
+        return os.stat(log_file).st_ino != os.fstat(handle.fileno()).st_ino
+    except FileNotFoundError:
+        return True
+
+
+atexit.register(_close_log_handles)
+
+
 def log_estimation(T_amb_est: float, uncertainty: float, T_cpu: float, P: float,
-                  log_file: str = "/var/log/thermal-manager/ambient_estimates.log") -> None:
+                  log_file: str = "/var/log/thermal-manager/ambient_estimates.log",
+                  timestamp: Optional[float] = None) -> None:
     """
     Log ambient temperature estimation with timestamp.
 
+    The log file is opened once (line-buffered) and kept open for later
+    calls, and reopened if logrotate or a delete replaces it (checked every
+    LOG_REOPEN_CHECK_INTERVAL seconds). The timestamp string is only
+    re-formatted when the second changes.
+
     Args:
         T_amb_est: Estimated ambient temperature in °C
         uncertainty: Uncertainty in °C
         T_cpu: CPU temperature in °C
         P: Power consumption in W
         log_file: Path to log file
+        timestamp: time.time() of the reading (default: now), for callers
+            that write the log entry after the fact
     """
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    global _LOG_TS_SECOND, _LOG_TS_TEXT
+
+    now = int(time.time() if timestamp is None else timestamp)
+    if now != _LOG_TS_SECOND:
+        _LOG_TS_TEXT = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _LOG_TS_SECOND = now
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = (f"[{timestamp}] T_amb={T_amb_est:.2f}±{uncertainty:.2f}°C "
+    log_entry = (f"[{_LOG_TS_TEXT}] T_amb={T_amb_est:.2f}±{uncertainty:.2f}°C "
                 f"(T_cpu={T_cpu:.1f}°C, P={P:.1f}W)\n")
 
-    with open(log_file, 'a') as f:
-        f.write(log_entry)
+    handle = _LOG_HANDLES.get(log_file)
+    if handle is not None:
+        mono = time.monotonic()
+        if mono >= _LOG_NEXT_CHECK[log_file]:
+            _LOG_NEXT_CHECK[log_file] = mono + LOG_REOPEN_CHECK_INTERVAL
+            if _log_file_replaced(handle, log_file):
+                # Writes would go to the unlinked inode: start a new file
+                handle.close()
+                handle = None
+    if handle is None:
+        _ensure_parent_dir(log_file)
+        handle = open(log_file, 'a', buffering=1)
+        _LOG_HANDLES[log_file] = handle
+        _LOG_NEXT_CHECK[log_file] = time.monotonic() + LOG_REOPEN_CHECK_INTERVAL
+
+    handle.write(log_entry)
 
 
 if __name__ == "__main__":
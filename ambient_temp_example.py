@@ -21,14 +21,20 @@ Usage:
     # Cooldown curve fitting
     python3 ambient_temp_example.py --cooldown
 
+    # Re-run a monitor log through the current calibration
+    python3 ambient_temp_example.py --replay /var/log/thermal-manager/ambient_estimates.log
+
 Author: Thermal Management System
 License: MIT
 """
 
 import argparse
+import math
+import queue
+import re
+import threading
 import time
 import sys
-from datetime import datetime
 from typing import List, Tuple
 
 try:
@@ -45,6 +51,50 @@ except ImportError:
     print("Error: ambient_temp_estimator.py must be in the same directory")
     sys.exit(1)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# °C -> °F: T_f = T_c * _F_SCALE + _F_OFFSET
+_F_SCALE = 1.8
+_F_OFFSET = 32.0
+
+# Timestamp format for monitor output
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Monitor table row, bound once instead of re-parsing the format every tick
+_ROW_FMT = "{:<20} {:<12.2f} {:<12.2f} {:<15.2f} ±{:.2f}°C".format
+
+
+def print_calibration_validation(estimator: AmbientTempEstimator,
+                                 samples: List[Tuple[float, float, float]]):
+    """
+    Print predicted vs. measured ambient temperature for calibration samples.
+
+    All predictions are computed in one estimate_batch() call.
+
+    Args:
+        estimator: Calibrated estimator
+        samples: List of (T_cpu, P, T_amb_measured) calibration samples
+    """
+    data = np.asarray(samples, dtype=np.float64)
+    T_cpu, P, T_amb_measured = data[:, 0], data[:, 1], data[:, 2]
+    T_amb_pred, _ = estimator.estimate_batch(T_cpu, P)
+    error = T_amb_pred - T_amb_measured
+
+    print("\n" + "-" * 70)
+    print("Calibration Validation - Predicted vs. Measured")
+    print("-" * 70)
+    print(f"{'T_cpu (°C)':<12} {'Power (W)':<12} {'Measured (°C)':<15} {'Predicted (°C)':<15} {'Error (°C)':<12}")
+    print("-" * 70)
+
+    for row in zip(T_cpu.tolist(), P.tolist(), T_amb_measured.tolist(),
+                   T_amb_pred.tolist(), error.tolist()):
+        print("{:<12.2f} {:<12.2f} {:<15.2f} {:<15.2f} {:<12.2f}".format(*row))
+
 
 def calibration_mode_interactive():
     """
@@ -140,16 +190,7 @@ def calibration_mode_interactive():
         print("\n📁 Calibration saved to:", estimator.config_file)
 
         # Show sample predictions
-        print("\n" + "-" * 70)
-        print("Calibration Validation - Predicted vs. Measured")
-        print("-" * 70)
-        print(f"{'T_cpu (°C)':<12} {'Power (W)':<12} {'Measured (°C)':<15} {'Predicted (°C)':<15} {'Error (°C)':<12}")
-        print("-" * 70)
-
-        for T_cpu, P, T_amb_measured in samples:
-            T_amb_pred, _ = estimator.estimate(T_cpu, P)
-            error = T_amb_pred - T_amb_measured
-            print(f"{T_cpu:<12.2f} {P:<12.2f} {T_amb_measured:<15.2f} {T_amb_pred:<15.2f} {error:<12.2f}")
+        print_calibration_validation(estimator, samples)
 
     except Exception as e:
         print(f"\n✗ Calibration failed: {e}")
@@ -197,6 +238,8 @@ def calibration_mode_example():
         print(f"  σ (Uncertainty):           ±{results['sigma']:.2f} °C")
         print(f"  R² (Fit Quality):          {results['r_squared']:.4f}")
 
+        print_calibration_validation(estimator, samples)
+
     except Exception as e:
         print(f"\n✗ Calibration failed: {e}")
 
@@ -248,14 +291,44 @@ def estimation_mode_single():
         print("=" * 70)
 
         # Also show in Fahrenheit
-        T_amb_f = T_amb_est * 9/5 + 32
-        uncertainty_f = uncertainty * 9/5
+        T_amb_f = T_amb_est * _F_SCALE + _F_OFFSET
+        uncertainty_f = uncertainty * _F_SCALE
         print(f"  (In Fahrenheit: {T_amb_f:.1f} ± {uncertainty_f:.1f}°F)")
 
     except Exception as e:
         print(f"\n✗ Estimation failed: {e}")
 
 
+# Records buffered for the log thread before new ones are dropped
+LOG_QUEUE_SIZE = 1024
+
+
+def _log_worker(log_q: queue.Queue) -> None:
+    """
+    Write queued estimation records to the log until a None sentinel arrives.
+
+    Runs in a background thread so disk latency never delays sampling.
+    After the first write error the remaining records are discarded.
+    The producer drops records rather than blocking when the queue is full.
+
+    Args:
+        log_q: Queue of (timestamp, T_amb_est, uncertainty, T_cpu, P) tuples
+    """
+    failed = False
+    while True:
+        record = log_q.get()
+        if record is None:
+            return
+        if failed:
+            continue
+        timestamp, T_amb_est, uncertainty, T_cpu, P = record
+        try:
+            log_estimation(T_amb_est, uncertainty, T_cpu, P, timestamp=timestamp)
+        except OSError as e:
+            print(f"⚠ Logging disabled: {e}")
+            failed = True
+
+
 def monitor_mode(duration: int = 300, interval: int = 10, enable_logging: bool = True):
     """
     Continuous monitoring mode.
@@ -289,12 +362,29 @@ def monitor_mode(duration: int = 300, interval: int = 10, enable_logging: bool =
     print(f"{'Timestamp':<20} {'T_cpu (°C)':<12} {'Power (W)':<12} {'T_amb_est (°C)':<15} {'Uncertainty':<12}")
     print("-" * 70)
 
-    start_time = time.time()
-    readings = []
+    # Log writes happen off the sampling loop
+    log_q = None
+    if enable_logging:
+        log_q = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        log_thread = threading.Thread(target=_log_worker, args=(log_q,), daemon=True)
+        log_thread.start()
+
+    # Sample on a fixed monotonic schedule so read/print/log time does not
+    # accumulate as drift
+    start = time.monotonic()
+    next_t = start
+
+    # Running statistics (Welford), so no per-reading history is kept
+    n = 0
+    mean = 0.0
+    M2 = 0.0
+    T_min = math.inf
+    T_max = -math.inf
 
     try:
-        while time.time() - start_time < duration:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        while time.monotonic() - start < duration:
+            now = time.time()
+            timestamp = time.strftime(_TS_FMT, time.localtime(now))
 
             # Read sensors
             try:
@@ -303,34 +393,112 @@ def monitor_mode(duration: int = 300, interval: int = 10, enable_logging: bool =
                 T_amb_est, uncertainty = estimator.estimate(T_cpu, P)
 
                 # Display
-                print(f"{timestamp:<20} {T_cpu:<12.2f} {P:<12.2f} {T_amb_est:<15.2f} ±{uncertainty:.2f}°C")
+                print(_ROW_FMT(timestamp, T_cpu, P, T_amb_est, uncertainty))
 
                 # Log if enabled
-                if enable_logging:
-                    log_estimation(T_amb_est, uncertainty, T_cpu, P)
-
-                # Store for statistics
-                readings.append(T_amb_est)
+                if log_q is not None:
+                    try:
+                        log_q.put_nowait((now, T_amb_est, uncertainty, T_cpu, P))
+                    except queue.Full:
+                        pass
+
+                # Update statistics
+                n += 1
+                delta = T_amb_est - mean
+                mean += delta / n
+                M2 += delta * (T_amb_est - mean)
+                if T_amb_est < T_min:
+                    T_min = T_amb_est
+                if T_amb_est > T_max:
+                    T_max = T_amb_est
 
             except Exception as e:
                 print(f"{timestamp:<20} Error: {e}")
 
-            time.sleep(interval)
+            next_t += interval
+            now = time.monotonic()
+            if next_t < now:
+                # Stalled past a whole slot: restart the schedule rather
+                # than firing the missed samples back to back
+                next_t = now + interval
+            time.sleep(next_t - now)
 
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped by user (Ctrl+C)")
 
+    # Let the logger drain what is queued
+    if log_q is not None:
+        try:
+            log_q.put(None, timeout=2)
+        except queue.Full:
+            pass  # Writer stuck on disk: it is a daemon thread, leave it
+        log_thread.join(timeout=2)
+
     # Show summary statistics
-    if readings:
-        import statistics
+    if n:
         print("\n" + "=" * 70)
         print("Summary Statistics")
         print("=" * 70)
-        print(f"  Total readings: {len(readings)}")
-        print(f"  Mean ambient:   {statistics.mean(readings):.2f}°C")
-        print(f"  Std deviation:  {statistics.stdev(readings):.2f}°C" if len(readings) > 1 else "  Std deviation:  N/A")
-        print(f"  Min ambient:    {min(readings):.2f}°C")
-        print(f"  Max ambient:    {max(readings):.2f}°C")
+        print(f"  Total readings: {n}")
+        print(f"  Mean ambient:   {mean:.2f}°C")
+        print(f"  Std deviation:  {math.sqrt(M2 / (n - 1)):.2f}°C" if n > 1 else "  Std deviation:  N/A")
+        print(f"  Min ambient:    {T_min:.2f}°C")
+        print(f"  Max ambient:    {T_max:.2f}°C")
+
+
+# One log_estimation() record: T_amb, uncertainty, T_cpu, P
+_LOG_RECORD_RE = re.compile(
+    r"T_amb=(-?[\d.]+)±([\d.]+)°C \(T_cpu=(-?[\d.]+)°C, P=(-?[\d.]+)W\)")
+
+
+def replay_mode(log_file: str):
+    """
+    Replay mode.
+
+    Re-estimates every reading in a monitor log with the current
+    calibration, in a single estimate_batch() call.
+
+    Args:
+        log_file: Log written by monitor mode / log_estimation()
+    """
+    print("\n" + "=" * 70)
+    print("REPLAY MODE - Re-estimate Logged Readings")
+    print("=" * 70)
+
+    if not NUMPY_AVAILABLE:
+        print("\n✗ NumPy required for replay")
+        print("Install with: pip3 install numpy")
+        return
+
+    estimator = AmbientTempEstimator()
+
+    if not estimator.calibrated:
+        print("\n✗ Estimator not calibrated!")
+        print("Run calibration mode first: python3 ambient_temp_example.py --calibrate")
+        return
+
+    try:
+        records = np.fromregex(log_file, _LOG_RECORD_RE,
+                               [('T_amb', 'f8'), ('sigma', 'f8'), ('T_cpu', 'f8'), ('P', 'f8')],
+                               encoding='utf-8')
+    except OSError as e:
+        print(f"\n✗ Cannot read {log_file}: {e}")
+        return
+
+    n = len(records)
+    if n == 0:
+        print(f"\n✗ No estimation records found in {log_file}")
+        return
+
+    T_amb_est, uncertainty = estimator.estimate_batch(records['T_cpu'], records['P'])
+    shift = T_amb_est - records['T_amb']
+
+    print(f"\n  Records:        {n}")
+    print(f"  Mean ambient:   {T_amb_est.mean():.2f} ± {uncertainty:.2f}°C "
+          f"(logged: {records['T_amb'].mean():.2f}°C)")
+    print(f"  Min ambient:    {T_amb_est.min():.2f}°C")
+    print(f"  Max ambient:    {T_amb_est.max():.2f}°C")
+    print(f"  Mean change:    {shift.mean():+.2f}°C (max |Δ| {np.abs(shift).max():.2f}°C)")
 
 
 def cooldown_mode():
@@ -350,6 +518,10 @@ def cooldown_mode():
     print("  3. Let the system cool naturally for 10-15 minutes")
     print("  4. This script will record temperature vs. time")
 
+    if not NUMPY_AVAILABLE:
+        print("\n✗ NumPy is required for curve fitting. Install with: pip3 install numpy")
+        return
+
     input("\nPress Enter when ready to start monitoring cooldown...")
 
     estimator = AmbientTempEstimator()
@@ -368,31 +540,44 @@ def cooldown_mode():
     print(f"{'Time (s)':<10} {'CPU Temp (°C)':<15}")
     print("-" * 30)
 
-    time_series = []
-    start_time = time.time()
     duration = 900  # 15 minutes
     interval = 30   # 30 seconds
 
+    # (time_seconds, T_cpu) rows, filled in place and handed to the fit as-is
+    time_series = np.empty((duration // interval + 1, 2))
+    n_points = 0
+
+    # Fixed monotonic schedule keeps the samples equispaced
+    start = time.monotonic()
+    next_t = start
+
     try:
-        while time.time() - start_time < duration:
-            elapsed = time.time() - start_time
+        while time.monotonic() - start < duration and n_points < len(time_series):
+            elapsed = time.monotonic() - start
             T_cpu = get_cpu_temperature()
 
             print(f"{elapsed:<10.0f} {T_cpu:<15.2f}")
-            time_series.append((elapsed, T_cpu))
+            time_series[n_points] = (elapsed, T_cpu)
+            n_points += 1
 
-            time.sleep(interval)
+            next_t += interval
+            now = time.monotonic()
+            if next_t < now:
+                # Stalled past a whole slot: restart the schedule rather
+                # than firing the missed samples back to back
+                next_t = now + interval
+            time.sleep(next_t - now)
 
     except KeyboardInterrupt:
         print("\n\nCooldown monitoring stopped by user (Ctrl+C)")
 
-    if len(time_series) < 5:
+    if n_points < 5:
         print("\n✗ Need at least 5 data points for curve fitting.")
         return
 
     # Fit cooldown curve
     try:
-        results = estimator.fit_cooldown_curve(time_series, T_amb_measured)
+        results = estimator.fit_cooldown_curve(time_series[:n_points], T_amb_measured)
 
         print("\n" + "=" * 70)
         print("Cooldown Curve Fitting Results")
@@ -508,7 +693,7 @@ def test_ambient_sources():
     try:
         temp = get_acpi_ambient_temperature()
         print(f"✓ ACPI sensor available")
-        print(f"  Temperature: {temp:.2f}°C ({temp * 9/5 + 32:.1f}°F)")
+        print(f"  Temperature: {temp:.2f}°C ({temp * _F_SCALE + _F_OFFSET:.1f}°F)")
     except Exception as e:
         print(f"✗ ACPI sensor not available: {e}")
 
@@ -519,7 +704,7 @@ def test_ambient_sources():
         temp, source = get_weather_ambient_temperature()
         print(f"✓ Weather API available")
         print(f"  Source: {source}")
-        print(f"  Temperature: {temp:.2f}°C ({temp * 9/5 + 32:.1f}°F)")
+        print(f"  Temperature: {temp:.2f}°C ({temp * _F_SCALE + _F_OFFSET:.1f}°F)")
     except Exception as e:
         print(f"✗ Weather API not available: {e}")
 
@@ -529,7 +714,7 @@ def test_ambient_sources():
     try:
         temp = get_cpu_temperature()
         print(f"✓ CPU sensor available")
-        print(f"  Temperature: {temp:.2f}°C ({temp * 9/5 + 32:.1f}°F)")
+        print(f"  Temperature: {temp:.2f}°C ({temp * _F_SCALE + _F_OFFSET:.1f}°F)")
         print(f"  Note: CPU temp includes self-heating, not true ambient")
     except Exception as e:
         print(f"✗ CPU sensor not available: {e}")
@@ -570,6 +755,9 @@ Examples:
 
   # Cooldown curve fitting
   python3 ambient_temp_example.py --cooldown
+
+  # Re-estimate a monitor log with the current calibration
+  python3 ambient_temp_example.py --replay /var/log/thermal-manager/ambient_estimates.log
         """
     )
 
@@ -595,6 +783,8 @@ Examples:
                        help='Continuous monitoring mode')
     parser.add_argument('--cooldown', action='store_true',
                        help='Cooldown curve fitting mode')
+    parser.add_argument('--replay', metavar='LOGFILE', default=None,
+                       help='Re-estimate all readings in a monitor log')
     parser.add_argument('--duration', type=int, default=300,
                        help='Monitoring duration in seconds (default: 300)')
     parser.add_argument('--interval', type=int, default=10,
@@ -627,6 +817,8 @@ Examples:
         monitor_mode(args.duration, args.interval, not args.no_log)
     elif args.cooldown:
         cooldown_mode()
+    elif args.replay:
+        replay_mode(args.replay)
     else:
         parser.print_help()
 
@@ -1,23 +1,69 @@
 #!/usr/bin/env python3
 import multiprocessing
+import os
 import time
 
-def stress_cpu(duration):
-    """CPU intensive work"""
-    end_time = time.time() + duration
-    while time.time() < end_time:
-        # CPU intensive calculation
-        result = sum(i * i for i in range(100000))
+# One BLAS thread per worker process: parallelism comes from one process per core
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Target length of one burst of work between deadline checks (seconds)
+BATCH_SECONDS = 0.1
+
+def stress_cpu(duration, core_id=None):
+    """CPU intensive work (pinned to core_id when given)"""
+    if core_id is not None:
+        try:
+            # Stay on one core so every core gets an even, steady load
+            os.sched_setaffinity(0, {core_id})
+        except (AttributeError, OSError):
+            pass  # Not supported here or core offline: run unpinned
+
+    end_time = time.monotonic() + duration
+    if NUMPY_AVAILABLE:
+        # 512x512 float32 matmul: both operands stay in L2, so the loop keeps
+        # the SIMD FMA units busy (much hotter than scalar Python math)
+        A = np.random.rand(512, 512).astype(np.float32)
+        B = np.empty_like(A)
+
+        def burn():
+            np.dot(A, A, out=B)
+    else:
+        def burn():
+            # CPU intensive calculation
+            sum(i * i for i in range(100000))
+
+    # Check the clock once per batch, resizing each batch from the last one's
+    # duration so a batch takes about BATCH_SECONDS on any CPU
+    batch = 1
+    now = time.monotonic()
+    while now < end_time:
+        for _ in range(batch):
+            burn()
+        elapsed = time.monotonic() - now
+        now += elapsed
+        batch = max(1, int(batch * BATCH_SECONDS / elapsed)) if elapsed > 0 else batch * 2
 
 if __name__ == "__main__":
     duration = 15 * 60  # 15 minutes
-    cores = multiprocessing.cpu_count()
+    try:
+        core_ids = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        core_ids = [None] * multiprocessing.cpu_count()
+    cores = len(core_ids)
 
     print(f"Starting CPU stress test on {cores} cores for {duration/60:.0f} minutes...")
 
     processes = []
-    for i in range(cores):
-        p = multiprocessing.Process(target=stress_cpu, args=(duration,))
+    for core_id in core_ids:
+        p = multiprocessing.Process(target=stress_cpu, args=(duration, core_id))
         p.start()
         processes.append(p)
 
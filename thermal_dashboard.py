@@ -5,9 +5,13 @@ Similar to Nomadnet interface style
 """
 
 import os
+import re
+import tempfile
+import threading
 import time
 import subprocess
 import multiprocessing
+from collections import deque
 from datetime import datetime
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
@@ -16,6 +20,24 @@ from textual.reactive import reactive
 from textual import work
 from textual.timer import Timer
 
+# One BLAS thread per heat worker: parallelism comes from one process per core
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: query and restart the service over D-Bus instead of forking systemctl
+try:
+    from pystemd.systemd1 import Manager as SystemdManager, Unit as SystemdUnit
+    PYSTEMD_AVAILABLE = True
+except ImportError:
+    PYSTEMD_AVAILABLE = False
+
 
 def heat_worker_process(worker_id, heating_flag, cpu_usage=0.70):
     """Worker process that generates CPU heat (runs in dashboard, no sudo needed)"""
@@ -26,18 +48,46 @@ def heat_worker_process(worker_id, heating_flag, cpu_usage=0.70):
     except ImportError:
         pass
 
+    # Keep worker i on its own core, and run at nice 10 so the control loop
+    # and any real workload on the box always preempt the heater
+    try:
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[worker_id % len(cores)]})
+    except (AttributeError, OSError):
+        pass  # Not supported here or core offline: run unpinned
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+
     # Calculate work/sleep cycle for target CPU usage
     work_time = cpu_usage  # seconds of work
     sleep_time = 1 - cpu_usage  # seconds of sleep
 
+    if NUMPY_AVAILABLE:
+        # float32 matmul keeps the SIMD FMA units busy, which turns far more
+        # power into heat per busy second than interpreted Python arithmetic
+        A = np.random.rand(256, 256).astype(np.float32)
+        B = np.empty_like(A)
+
+        def burn():
+            np.dot(A, A, out=B)
+    else:
+        def burn():
+            sum(i * i for i in range(1000))
+
+    # Bursts per work period, re-fitted from each period's measured length,
+    # so the clock is read twice per cycle instead of after every burst
+    bursts = 1
+
     while True:
         if heating_flag.value:
             # Do CPU-intensive work
-            start = time.time()
-            result = 0
-            # Simple CPU-intensive calculation
-            while time.time() - start < work_time:
-                result += sum(i * i for i in range(1000))
+            start = time.monotonic()
+            for _ in range(bursts):
+                burn()
+            elapsed = time.monotonic() - start
+            bursts = max(1, round(bursts * work_time / elapsed)) if elapsed > 0 else bursts * 2
 
             # Sleep to achieve target CPU usage
             if sleep_time > 0:
@@ -47,31 +97,62 @@ def heat_worker_process(worker_id, heating_flag, cpu_usage=0.70):
             break
 
 
+# Status markers written by thermal_manager.py, matched in one scan
+_HEATING_STATE_RE = re.compile(r'HEATING(?: ON| OFF)?:|IDLE(?::| \()')
+_HEATING_STATES = {
+    'HEATING ON:': 'HEATING',
+    'HEATING:': 'HEATING',
+    'HEATING OFF:': 'IDLE',
+}
+
+
+# A whole-degree threshold as typed into the config inputs
+_INT_RE = re.compile(r'-?\d+')
+
+# KEY=value lines in the config file; keys map to temp_min / temp_target
+_CONFIG_RE = re.compile(r'^\s*(TEMP_MIN|TEMP_TARGET)=(-?\d+)\s*$', re.MULTILINE)
+
+
+def heating_state_from_log_line(line):
+    """Return 'HEATING'/'IDLE' if a thermal manager log line reports it, else None"""
+    m = _HEATING_STATE_RE.search(line)
+    if m is None:
+        return None
+    return _HEATING_STATES.get(m.group(), 'IDLE')
+
+
 class TemperatureDisplay(Static):
     """Display current temperatures"""
     acpi_temp = reactive(0.0)
     cpu_temp = reactive(0.0)
 
-    def render(self) -> str:
-        acpi_f = (self.acpi_temp * 9/5) + 32
-        cpu_f = (self.cpu_temp * 9/5) + 32
-
-        # Color coding based on temperature
-        acpi_color = "green" if self.acpi_temp > 0 else "red"
-
-        return f"""
+    # Static skeleton; render() only fills in the values
+    TEMPLATE = """
 [bold cyan]═══════════════════════════════════════════════════[/]
 [bold white]           TEMPERATURE MONITORING[/]
 [bold cyan]═══════════════════════════════════════════════════[/]
 
   [bold]ACPI (Case Ambient):[/]
-    [{acpi_color}]▓▓▓▓▓ {self.acpi_temp:5.1f}°C ({acpi_f:5.1f}°F) ▓▓▓▓▓[/]
+    [{acpi_color}]▓▓▓▓▓ {acpi:5.1f}°C ({acpi_f:5.1f}°F) ▓▓▓▓▓[/]
 
   [bold]CPU Package:[/]
-    [yellow]▓▓▓▓▓ {self.cpu_temp:5.1f}°C ({cpu_f:5.1f}°F) ▓▓▓▓▓[/]
+    [yellow]▓▓▓▓▓ {cpu:5.1f}°C ({cpu_f:5.1f}°F) ▓▓▓▓▓[/]
 
 [bold cyan]═══════════════════════════════════════════════════[/]
-"""
+""".format
+
+    def render(self) -> str:
+        acpi = self.acpi_temp
+        cpu = self.cpu_temp
+
+        return self.TEMPLATE(
+            acpi=acpi,
+            acpi_f=acpi * 1.8 + 32,
+            cpu=cpu,
+            cpu_f=cpu * 1.8 + 32,
+            # Color coding based on temperature
+            acpi_color="green" if acpi > 0 else "red",
+        )
 
 
 class StatusDisplay(Static):
@@ -81,31 +162,50 @@ class StatusDisplay(Static):
     uptime = reactive("--:--:--")
     manual_override = reactive(False)
 
-    def render(self) -> str:
-        # Status colors
-        heat_color = "red" if self.heating_status == "HEATING" else "green"
-        service_color = "green" if "active" in self.service_status.lower() else "red"
-
-        override_text = "[yellow]MANUAL OVERRIDE ACTIVE[/]" if self.manual_override else ""
-
-        return f"""
+    # Static skeleton; render() only fills in the values
+    TEMPLATE = """
 [bold cyan]═══════════════════════════════════════════════════[/]
 [bold white]              SYSTEM STATUS[/]
 [bold cyan]═══════════════════════════════════════════════════[/]
 
-  [bold]Heating:[/] [{heat_color}]● {self.heating_status}[/]
-  [bold]Service:[/] [{service_color}]● {self.service_status}[/]
-  [bold]Uptime:[/]  [white]{self.uptime}[/]
+  [bold]Heating:[/] [{heat_color}]● {heating}[/]
+  [bold]Service:[/] [{service_color}]● {service}[/]
+  [bold]Uptime:[/]  [white]{uptime}[/]
 
   {override_text}
 
 [bold cyan]═══════════════════════════════════════════════════[/]
-"""
+""".format
+
+    def render(self) -> str:
+        return self.TEMPLATE(
+            heating=self.heating_status,
+            service=self.service_status,
+            uptime=self.uptime,
+            # Status colors
+            heat_color="red" if self.heating_status == "HEATING" else "green",
+            service_color="green" if "active" in self.service_status.lower() else "red",
+            override_text="[yellow]MANUAL OVERRIDE ACTIVE[/]" if self.manual_override else "",
+        )
 
 
 class ThermalDashboard(App):
     """Thermal Management Dashboard TUI Application"""
 
+    # Seconds to reuse the last `systemctl is-active` answer
+    SERVICE_STATUS_TTL = 30.0
+
+    # Refresh every REFRESH_INTERVAL seconds, relaxing to REFRESH_IDLE_INTERVAL
+    # after REFRESH_STEADY_TICKS refreshes with no heating and temperatures
+    # within TEMP_STEADY_DELTA °C of the previous reading
+    REFRESH_INTERVAL = 2.0
+    REFRESH_IDLE_INTERVAL = 8.0
+    REFRESH_STEADY_TICKS = 5
+    TEMP_STEADY_DELTA = 0.2
+
+    # Bytes of existing log read when the log file is (re)opened
+    LOG_TAIL_BYTES = 8192
+
     CSS = """
     Screen {
         background: $surface;
@@ -193,7 +293,7 @@ class ThermalDashboard(App):
         super().__init__()
         self.override_file = "/tmp/thermal_override"
         self.config_file = "/tmp/thermal_config"
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         # Use environment variable or fallback to default location
         self.log_file = os.environ.get("LOG_FILE", "/var/log/thermal-manager/thermal_manager.log")
 
@@ -203,9 +303,39 @@ class ThermalDashboard(App):
         self.load_config()
 
         # Manual heating workers (run without sudo!)
-        self.manual_heating_active = multiprocessing.Value('i', 0)
+        # On/off flag shared with the workers; one writer, so no lock needed
+        self.manual_heating_active = multiprocessing.RawValue('b', 0)
         self.manual_workers = []
 
+        # sysfs temperature files, kept open and re-read with pread
+        self.zone_paths = {
+            'acpi': '/sys/class/thermal/thermal_zone0/temp',
+            'cpu': '/sys/class/thermal/thermal_zone1/temp',
+        }
+        self._zone_fds = {}
+
+        # Incremental log tail: the file is read once, then only appended
+        # bytes. New lines feed both the heating status and the log view.
+        self._log_fd = None
+        self._log_inode = None  # Detects logrotate replacing the file
+        self._log_offset = 0
+        self._log_partial = b''
+        self._log_skip_first = False  # Opened mid-line: drop the first fragment
+        self._log_pending = deque(maxlen=50)  # Lines not yet shown in the Log widget
+        self._log_error = None  # Last read error reported in the Log widget
+        self._heating_status = 'UNKNOWN'
+
+        # Cached service state (refreshed every SERVICE_STATUS_TTL seconds
+        # when it has to come from systemctl)
+        self._service_status = None
+        self._service_checked = 0.0
+        self._service_unit = None  # pystemd Unit, loaded on first use
+
+        # Held by the refresh worker thread; a tick that finds it taken is skipped
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer = None
+        self._steady_ticks = 0
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header(show_clock=True)
@@ -238,45 +368,102 @@ class ThermalDashboard(App):
 
     def on_mount(self) -> None:
         """Set up the application on mount."""
+        # These widgets live as long as the app: look them up once
+        self._temp_display = self.query_one("#temp_display", TemperatureDisplay)
+        self._status_display = self.query_one("#status_display", StatusDisplay)
+        self._log_widget = self.query_one("#logs", Log)
+        self._left_panel = self.query_one("#left_panel")
+        self._temp_min_input = self.query_one("#temp_min", Input)
+        self._temp_target_input = self.query_one("#temp_target", Input)
+
+        # Initial data and logs; each refresh schedules the next one
         self.update_data()
-        self.set_interval(2.0, self.update_data)
 
-        # Load initial logs
-        self.load_logs()
-
-    @work(exclusive=True)
-    async def update_data(self) -> None:
-        """Update all dashboard data"""
-        # Get temperatures
-        temps = self.get_temperatures()
-        temp_display = self.query_one("#temp_display", TemperatureDisplay)
-        temp_display.acpi_temp = temps['acpi']
-        temp_display.cpu_temp = temps['cpu']
-
-        # Get status
-        status = self.get_status()
-        status_display = self.query_one("#status_display", StatusDisplay)
-        status_display.heating_status = status['heating']
-        status_display.service_status = status['service']
-        status_display.uptime = status['uptime']
-        # Check if manual workers are actually running
-        status_display.manual_override = len(self.manual_workers) > 0 and any(p.is_alive() for p in self.manual_workers)
+    @work(thread=True)
+    def update_data(self) -> None:
+        """Read all dashboard data on a worker thread"""
+        # sysfs, log and systemctl reads block, so they stay off the UI
+        # thread; only the widget updates are handed back to it
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # Previous refresh still running
+        delay = self.REFRESH_INTERVAL
+        try:
+            temps = self.get_temperatures()
+            log_error = self.read_logs()
+            status = self.get_status()
+            delay = self.call_from_thread(self.show_data, temps, status, log_error)
+        except Exception as e:
+            # A failed read must not end the refresh cycle (or the app)
+            self.call_from_thread(self.report_refresh_error, str(e))
+        finally:
+            self._refresh_lock.release()
+            # Always arm the next refresh, whatever happened above
+            self.call_from_thread(self.schedule_refresh, delay)
+
+    def schedule_refresh(self, delay: float) -> None:
+        """Run update_data again in delay seconds (UI thread)"""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(delay, self.update_data)
+
+    def report_refresh_error(self, error_msg: str) -> None:
+        """Show a failed refresh in the log viewer"""
+        self._log_widget.write_line(f"[red]>>> REFRESH: Failed to read status - {error_msg}[/]")
+
+    def show_data(self, temps: dict, status: dict, log_error=None) -> float:
+        """Update all dashboard widgets (UI thread)
+
+        Returns:
+            Seconds until the next refresh
+        """
+        temp_display = self._temp_display
+        # Rounded to the displayed 0.1°C so sensor jitter below that
+        # leaves the reactive unchanged and skips the re-render
+        acpi = round(temps['acpi'], 1)
+        cpu = round(temps['cpu'], 1)
+        steady = (abs(acpi - temp_display.acpi_temp) < self.TEMP_STEADY_DELTA
+                  and abs(cpu - temp_display.cpu_temp) < self.TEMP_STEADY_DELTA)
+        status_display = self._status_display
+
+        # All of this tick's changes reach the screen in one repaint
+        with self.batch_update():
+            temp_display.acpi_temp = acpi
+            temp_display.cpu_temp = cpu
+
+            status_display.heating_status = status['heating']
+            status_display.service_status = status['service']
+            status_display.uptime = status['uptime']
+            # Check if manual workers are actually running
+            status_display.manual_override = len(self.manual_workers) > 0 and any(p.is_alive() for p in self.manual_workers)
+
+            # Show log lines picked up by read_logs()
+            self.load_logs(log_error)
+
+        # Poll less often while nothing is changing
+        if steady and status['heating'] != 'HEATING' and not status_display.manual_override:
+            self._steady_ticks += 1
+        else:
+            self._steady_ticks = 0
+        if self._steady_ticks >= self.REFRESH_STEADY_TICKS:
+            return self.REFRESH_IDLE_INTERVAL
+        return self.REFRESH_INTERVAL
 
     def get_temperatures(self) -> dict:
         """Read current temperatures"""
         temps = {'acpi': 0.0, 'cpu': 0.0}
 
-        try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                temps['acpi'] = int(f.read().strip()) / 1000.0
-        except:
-            pass
-
-        try:
-            with open('/sys/class/thermal/thermal_zone1/temp', 'r') as f:
-                temps['cpu'] = int(f.read().strip()) / 1000.0
-        except:
-            pass
+        for name, path in self.zone_paths.items():
+            try:
+                fd = self._zone_fds.get(name)
+                if fd is None:
+                    fd = self._zone_fds[name] = os.open(path, os.O_RDONLY)
+                # One syscall per reading: pread re-reads the sysfs file from offset 0
+                temps[name] = int(os.pread(fd, 16, 0)) / 1000.0
+            except (OSError, ValueError):
+                # Sensor missing or went away: reopen on the next tick
+                fd = self._zone_fds.pop(name, None)
+                if fd is not None:
+                    os.close(fd)
 
         return temps
 
@@ -288,71 +475,147 @@ class ThermalDashboard(App):
             'uptime': '--:--:--'
         }
 
-        # Check if heating is active by looking at logs (try without sudo first)
-        try:
-            # Try to read log file directly (works if readable)
-            if os.path.exists(self.log_file) and os.access(self.log_file, os.R_OK):
-                with open(self.log_file, 'r') as f:
-                    lines = f.readlines()[-10:]  # Last 10 lines
-                    for line in reversed(lines):
-                        if line.strip():
-                            if 'HEATING ON:' in line or 'HEATING:' in line:
-                                status['heating'] = 'HEATING'
-                                break
-                            elif 'HEATING OFF:' in line or 'IDLE:' in line or 'IDLE (' in line:
-                                status['heating'] = 'IDLE'
-                                break
-        except Exception as e:
-            # If log file doesn't exist or can't be read, status stays UNKNOWN
-            pass
-
-        # Check service status (try without sudo)
-        try:
-            result = subprocess.run(['systemctl', 'is-active', 'thermal-manager.service'],
-                                  capture_output=True, text=True, timeout=2)
-            svc_status = result.stdout.strip()
+        # Heating state as last seen in the logs (updated by read_logs)
+        status['heating'] = self._heating_status
+
+        # Check service status (try without sudo). Over D-Bus this is a
+        # property read; systemctl is forked at most once per SERVICE_STATUS_TTL.
+        now = time.monotonic()
+        svc_status = self.get_service_active_state()
+        if svc_status is None and (self._service_status is None or now - self._service_checked >= self.SERVICE_STATUS_TTL):
+            try:
+                result = subprocess.run(['systemctl', 'is-active', 'thermal-manager.service'],
+                                      capture_output=True, text=True, timeout=2)
+                svc_status = result.stdout.strip()
+            except Exception as e:
+                svc_status = 'unknown'
+        if svc_status is not None:
             # Make it more readable
             if svc_status == 'active':
-                status['service'] = 'ACTIVE'
+                self._service_status = 'ACTIVE'
             elif svc_status == 'inactive':
-                status['service'] = 'INACTIVE'
+                self._service_status = 'INACTIVE'
             elif svc_status == 'failed':
-                status['service'] = 'FAILED'
+                self._service_status = 'FAILED'
             else:
-                status['service'] = svc_status.upper()
-        except Exception as e:
-            status['service'] = 'UNKNOWN'
+                self._service_status = svc_status.upper()
+            self._service_checked = now
+        status['service'] = self._service_status
 
         # Calculate uptime
-        uptime_seconds = int(time.time() - self.start_time)
-        hours = uptime_seconds // 3600
-        minutes = (uptime_seconds % 3600) // 60
-        seconds = uptime_seconds % 60
+        minutes, seconds = divmod(int(time.monotonic() - self.start_time), 60)
+        hours, minutes = divmod(minutes, 60)
         status['uptime'] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
         return status
 
-    def load_logs(self) -> None:
-        """Load recent logs into the log viewer"""
-        log_widget = self.query_one("#logs", Log)
+    def get_service_active_state(self):
+        """
+        Read the service's ActiveState over D-Bus.
 
+        Returns:
+            State such as 'active' or 'failed', or None if pystemd is not
+            installed or the bus cannot be reached
+        """
+        if not PYSTEMD_AVAILABLE:
+            return None
+        try:
+            if self._service_unit is None:
+                unit = SystemdUnit(b'thermal-manager.service')
+                unit.load()
+                self._service_unit = unit
+            return self._service_unit.Unit.ActiveState.decode()
+        except Exception:
+            # Reconnect next time; systemctl covers this tick
+            self._service_unit = None
+            return None
+
+    def poll_log(self) -> None:
+        """
+        Read lines appended to the log file since the last call.
+
+        The file is opened once and read from the last offset, so each
+        tick costs only the new bytes. On open only the last LOG_TAIL_BYTES
+        are read, and a new inode at the log path (rotation) or a file
+        shorter than the saved offset (truncation) reopens it.
+        Complete lines update the heating status and are queued for the
+        log viewer.
+
+        Raises:
+            OSError: If the log file cannot be opened or read
+        """
+        st = os.stat(self.log_file)
+        if self._log_fd is not None and (st.st_ino != self._log_inode
+                                         or st.st_size < self._log_offset):
+            # Rotated or truncated in place: lines still unread are dropped
+            os.close(self._log_fd)
+            self._log_fd = None
+
+        if self._log_fd is None:
+            self._log_fd = os.open(self.log_file, os.O_RDONLY)
+            st = os.fstat(self._log_fd)
+            self._log_inode = st.st_ino
+            self._log_offset = max(0, st.st_size - self.LOG_TAIL_BYTES)
+            self._log_partial = b''
+            self._log_skip_first = self._log_offset > 0
+
+        chunks = []
+        while True:
+            chunk = os.pread(self._log_fd, 65536, self._log_offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self._log_offset += len(chunk)
+        if not chunks:
+            return
+
+        # Keep a trailing partial line until the rest of it is written
+        lines = (self._log_partial + b''.join(chunks)).split(b'\n')
+        self._log_partial = lines.pop()
+        if self._log_skip_first and lines:
+            del lines[0]
+            self._log_skip_first = False
+
+        new_lines = [line for line in (raw.decode(errors='replace').strip() for raw in lines) if line]
+        self._log_pending.extend(new_lines)
+
+        # Only the most recent status line matters
+        for line in reversed(new_lines):
+            state = heating_state_from_log_line(line)
+            if state is not None:
+                self._heating_status = state
+                break
+
+    def read_logs(self):
+        """Poll the log file, returning an error message if it can't be read"""
         try:
             # Try to read log file directly (works if readable)
-            if os.path.exists(self.log_file) and os.access(self.log_file, os.R_OK):
-                with open(self.log_file, 'r') as f:
-                    lines = f.readlines()[-50:]  # Last 50 lines
-                    for line in lines:
-                        if line.strip():
-                            log_widget.write_line(line.strip())
-            else:
-                log_widget.write_line("[yellow]No logs available (file not readable without sudo)[/]")
-        except Exception as e:
-            log_widget.write_line(f"[yellow]Cannot read logs: {str(e)}[/]")
+            self.poll_log()
+        except PermissionError:
+            return "[yellow]No logs available (file not readable without sudo)[/]"
+        except OSError as e:
+            return f"[yellow]Cannot read logs: {str(e)}[/]"
+        return None
+
+    def load_logs(self, error=None) -> None:
+        """Append new log lines (and a read error, if any) to the log viewer"""
+        log_widget = self._log_widget
+
+        # Report a failure once, not on every tick
+        if error is not None and error != self._log_error:
+            log_widget.write_line(error)
+        self._log_error = error
+
+        # One widget update for the whole batch. Only the lines present now
+        # are taken; the refresh worker may be appending more.
+        if self._log_pending:
+            pending = self._log_pending
+            log_widget.write_lines([pending.popleft() for _ in range(len(pending))])
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
         button_id = event.button.id
-        log_widget = self.query_one("#logs", Log)
+        log_widget = self._log_widget
 
         if button_id == "heat_on":
             self.force_heating_on()
@@ -399,7 +662,7 @@ class ThermalDashboard(App):
                 p.start()
                 self.manual_workers.append(p)
 
-            log_widget = self.query_one("#logs", Log)
+            log_widget = self._log_widget
             log_widget.write_line(f"[green]>>> Started {cores_to_use} manual heating workers (no sudo required)[/]")
         except Exception as e:
             print(f"Error starting manual heating: {e}")
@@ -421,7 +684,7 @@ class ThermalDashboard(App):
                 # Clear the list
                 self.manual_workers.clear()
 
-                log_widget = self.query_one("#logs", Log)
+                log_widget = self._log_widget
                 log_widget.write_line(f"[green]>>> Stopped manual heating workers[/]")
 
             # Also clean up any dead workers
@@ -434,15 +697,12 @@ class ThermalDashboard(App):
     def load_config(self) -> None:
         """Load temperature configuration from file"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    lines = f.readlines()
-                    for line in lines:
-                        line = line.strip()
-                        if line.startswith("TEMP_MIN="):
-                            self.temp_min = int(line.split("=")[1])
-                        elif line.startswith("TEMP_TARGET="):
-                            self.temp_target = int(line.split("=")[1])
+            with open(self.config_file, 'r') as f:
+                text = f.read()
+            for key, value in _CONFIG_RE.findall(text):
+                setattr(self, key.lower(), int(value))
+        except FileNotFoundError:
+            pass  # No saved config yet: keep defaults
         except Exception as e:
             print(f"Error loading config: {e}")
             # Use defaults
@@ -453,12 +713,16 @@ class ThermalDashboard(App):
         """Save temperature configuration from input widgets"""
         try:
             # Get input values
-            temp_min_input = self.query_one("#temp_min", Input)
-            temp_target_input = self.query_one("#temp_target", Input)
+            temp_min_input = self._temp_min_input
+            temp_target_input = self._temp_target_input
 
             # Validate inputs
-            temp_min = int(temp_min_input.value)
-            temp_target = int(temp_target_input.value)
+            temp_min_text = temp_min_input.value.strip()
+            temp_target_text = temp_target_input.value.strip()
+            if not (_INT_RE.fullmatch(temp_min_text) and _INT_RE.fullmatch(temp_target_text)):
+                return False  # Invalid: not whole numbers
+            temp_min = int(temp_min_text)
+            temp_target = int(temp_target_text)
 
             if temp_target <= temp_min:
                 return False  # Invalid: target must be higher than min
@@ -467,43 +731,90 @@ class ThermalDashboard(App):
             self.temp_min = temp_min
             self.temp_target = temp_target
 
-            # Write config file
-            with open(self.config_file, 'w') as f:
-                f.write(f"TEMP_MIN={temp_min}\n")
-                f.write(f"TEMP_TARGET={temp_target}\n")
-
-            # Make it world-readable so the service can read it
-            os.chmod(self.config_file, 0o644)
+            contents = f"TEMP_MIN={temp_min}\nTEMP_TARGET={temp_target}\n"
+            try:
+                with open(self.config_file, 'r') as f:
+                    if f.read() == contents:
+                        return True  # Already saved
+            except OSError:
+                pass
+
+            # Write config file via a temp file and rename, so the service
+            # never reads a half-written config
+            config_dir = os.path.dirname(self.config_file) or '.'
+            fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix='.thermal_config.')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(contents)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                # Make it world-readable so the service can read it
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.config_file)
+            except PermissionError:
+                # Sticky /tmp: a config owned by another user (e.g. root)
+                # cannot be replaced, but may still be writable in place
+                os.unlink(tmp_path)
+                with open(self.config_file, 'w') as f:
+                    f.write(contents)
+                try:
+                    os.chmod(self.config_file, 0o644)
+                except OSError:
+                    pass  # Not our file: keep its existing mode
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
 
+    @work(thread=True, exclusive=True, group="service")
     def restart_service(self) -> None:
-        """Restart the thermal manager service (prompts for sudo password in terminal)"""
-        log_widget = self.query_one("#logs", Log)
+        """Restart the thermal manager service on a worker thread"""
+        error_msg = None
         try:
-            # Use sudo (will prompt for password in terminal)
-            result = subprocess.run(['sudo', 'systemctl', 'restart', 'thermal-manager.service'],
-                                  capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                log_widget.write_line(f"[green]>>> SERVICE: Restart successful at {datetime.now().strftime('%H:%M:%S')}[/]")
+            if PYSTEMD_AVAILABLE:
+                try:
+                    # systemd queues the restart job and returns at once.
+                    # Needs a polkit rule granting manage-units to this user.
+                    with SystemdManager() as manager:
+                        manager.Manager.RestartUnit(b'thermal-manager.service', b'replace')
+                    restarted = True
+                except Exception:
+                    restarted = False
             else:
-                error_msg = result.stderr if result.stderr else "Check terminal for password prompt"
-                log_widget.write_line(f"[red]>>> SERVICE: Restart failed - {error_msg}[/]")
+                restarted = False
+
+            if not restarted:
+                # Use sudo (will prompt for password in terminal)
+                result = subprocess.run(['sudo', 'systemctl', 'restart', 'thermal-manager.service'],
+                                      capture_output=True, text=True, timeout=30)
+                if result.returncode != 0:
+                    error_msg = result.stderr if result.stderr else "Check terminal for password prompt"
         except Exception as e:
-            log_widget.write_line(f"[red]>>> SERVICE: Restart failed - {str(e)}[/]")
+            error_msg = str(e)
+
+        # Service state just changed: query it again on the next tick
+        self._service_status = None
+        self.call_from_thread(self.report_restart, error_msg)
+
+    def report_restart(self, error_msg=None) -> None:
+        """Show the outcome of restart_service in the log viewer"""
+        log_widget = self._log_widget
+        if error_msg is None:
+            log_widget.write_line(f"[green]>>> SERVICE: Restart successful at {datetime.now().strftime('%H:%M:%S')}[/]")
+        else:
+            log_widget.write_line(f"[red]>>> SERVICE: Restart failed - {error_msg}[/]")
 
     def action_view_full_logs(self) -> None:
-        """View full logs in less"""
-        self.exit()
-        os.system(f'sudo less +G {self.log_file}')
-        os.system(f'less +G {self.log_file}')
+        """View full logs in less (opened once the dashboard has exited)"""
+        self.exit(result=self.log_file)
 
     def action_refresh(self) -> None:
         """Manual refresh"""
         self.update_data()
-        self.load_logs()
 
     def action_toggle_heating(self) -> None:
         """Toggle heating via keyboard shortcut"""
@@ -515,16 +826,23 @@ class ThermalDashboard(App):
 
     def action_scroll_up(self) -> None:
         """Scroll the left panel up"""
-        left_panel = self.query_one("#left_panel")
+        left_panel = self._left_panel
         left_panel.scroll_up()
 
     def action_scroll_down(self) -> None:
         """Scroll the left panel down"""
-        left_panel = self.query_one("#left_panel")
+        left_panel = self._left_panel
         left_panel.scroll_down()
 
     def on_unmount(self) -> None:
         """Clean up manual workers when dashboard closes"""
+        for fd in self._zone_fds.values():
+            os.close(fd)
+        self._zone_fds.clear()
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
         try:
             if self.manual_workers:
                 self.manual_heating_active.value = 0
@@ -537,6 +855,16 @@ class ThermalDashboard(App):
             pass
 
 
+def view_log(log_file):
+    """Replace this process with less on the log, via sudo only if needed"""
+    if os.access(log_file, os.R_OK):
+        os.execvp('less', ['less', '+G', log_file])
+    else:
+        os.execvp('sudo', ['sudo', 'less', '+G', log_file])
+
+
 if __name__ == "__main__":
     app = ThermalDashboard()
-    app.run()
+    log_to_view = app.run()
+    if log_to_view:
+        view_log(log_to_view)
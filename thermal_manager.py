@@ -4,12 +4,31 @@ Thermal Management Service for Cold Weather Deployments
 Monitors temperature and generates CPU heat when below freezing
 """
 
+import atexit
+import ctypes
+import glob
+import logging
 import os
+import queue
+import select
+import struct
 import time
 import multiprocessing
 import signal
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# One BLAS thread per heat worker: parallelism comes from one process per core
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # Configuration
 CHECK_INTERVAL = 10     # Check temperature every 10 seconds
@@ -17,34 +36,74 @@ CPU_USAGE = 0.70        # Use 70% of available CPU for heating (leave 30% headro
 LOG_FILE = os.environ.get("LOG_FILE", "/var/log/thermal-manager/thermal_manager.log")
 OVERRIDE_FILE = "/tmp/thermal_override"  # Manual override file
 CONFIG_FILE = "/tmp/thermal_config"      # Temperature configuration file
+LOG_MAX_BYTES = 5 * 1024 * 1024         # Rotate the log file at this size
+LOG_BACKUPS = 3                         # Rotated log files to keep
+OVERRIDE_RECHECK_TICKS = 3              # Re-read the override file at least every N checks
 
-# Global flag for worker processes
-heating_active = multiprocessing.Value('i', 0)
+# Global flag for worker processes. A lock-free shared byte: only the main
+# loop writes it, and a single-byte store is atomic
+heating_active = multiprocessing.RawValue('b', 0)
 
 
-def log(message):
-    """Log message with timestamp"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_msg = f"[{timestamp}] {message}"
-    print(log_msg)
-    try:
-        # Ensure log directory exists
-        log_dir = os.path.dirname(LOG_FILE)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, mode=0o755, exist_ok=True)
+_logger = logging.getLogger("thermal_manager")
+_log_listener = None  # Writes queued log records to stdout and LOG_FILE
+
 
-        # Write to log file
-        with open(LOG_FILE, 'a') as f:
-            f.write(log_msg + "\n")
+class _ReadableLogHandler(RotatingFileHandler):
+    """Rotating log file that stays world-readable after every rollover"""
 
+    def _open(self):
+        stream = super()._open()
         # Make log file world-readable so dashboard can read it without sudo
         try:
-            os.chmod(LOG_FILE, 0o644)
-        except:
+            os.chmod(self.baseFilename, 0o644)
+        except OSError:
             pass
-    except Exception as e:
+        return stream
+
+
+def setup_logging():
+    """
+    Route log() through a background writer thread.
+
+    log() only enqueues the record; a QueueListener thread prints it and
+    appends it to LOG_FILE, which is kept open and rotated at
+    LOG_MAX_BYTES, so the control loop never waits on the disk.
+    """
+    global _log_listener
+    handlers = [logging.StreamHandler(sys.stdout)]
+    try:
+        # Ensure log directory exists
+        log_dir = os.path.dirname(LOG_FILE)
+        if log_dir:
+            os.makedirs(log_dir, mode=0o755, exist_ok=True)
+        handlers.append(_ReadableLogHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES,
+                                            backupCount=LOG_BACKUPS))
+    except OSError as e:
         print(f"Warning: Could not write to log file {LOG_FILE}: {e}")
 
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", "%Y-%m-%d %H:%M:%S")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _logger.addHandler(QueueHandler(log_queue))
+    _logger.setLevel(logging.INFO)
+    _logger.propagate = False
+    _log_listener = QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    # Drain what is still queued when the service exits
+    atexit.register(_log_listener.stop)
+
+
+def log(message):
+    """Log message with timestamp"""
+    if _log_listener is None:
+        # Logging not set up (module used outside main()): print only
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+        return
+    _logger.info(message)
+
 
 def load_temp_config():
     """Load temperature configuration from file
@@ -54,87 +113,189 @@ def load_temp_config():
     temp_target = 5  # Default: stop heating above 5°C
 
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                lines = f.readlines()
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("TEMP_MIN="):
-                        temp_min = int(line.split("=")[1])
-                    elif line.startswith("TEMP_TARGET="):
-                        temp_target = int(line.split("=")[1])
+        with open(CONFIG_FILE, 'r') as f:
+            lines = f.readlines()
+            for line in lines:
+                line = line.strip()
+                if line.startswith("TEMP_MIN="):
+                    temp_min = int(line.split("=")[1])
+                elif line.startswith("TEMP_TARGET="):
+                    temp_target = int(line.split("=")[1])
     except Exception as e:
         pass  # Use defaults if config can't be read
 
     return temp_min, temp_target
 
 
+# Override file contents -> (override_active, force_heating_on)
+_OVERRIDE_COMMANDS = {
+    "HEATING_ON": (True, True),
+    "HEATING_OFF": (True, False),
+}
+
+
 def check_manual_override():
     """Check if manual override is active
     Returns: (override_active, force_heating_on)
     """
     try:
-        if os.path.exists(OVERRIDE_FILE):
-            with open(OVERRIDE_FILE, 'r') as f:
-                command = f.read().strip()
-                if command == "HEATING_ON":
-                    return True, True
-                elif command == "HEATING_OFF":
-                    return True, False
+        with open(OVERRIDE_FILE, 'r') as f:
+            return _OVERRIDE_COMMANDS.get(f.read().strip(), (False, False))
+    except FileNotFoundError:
+        pass  # No override requested
     except Exception as e:
         log(f"WARNING: Error reading override file: {e}")
     return False, False
 
 
-def get_ambient_temp():
-    """Read ambient/ACPI temperature (not CPU temp - we want case temperature)"""
-    # Prefer ACPI thermal zone (zone0 = acpitz on Zima board)
-    # This measures actual case ambient, not CPU self-heating
+# Thermal zones as [(temp fd, zone type), ...], discovered on first use. The
+# sensor layout is fixed while the service runs, so each reading is one pread.
+_thermal_zones = None
+_acpi_zone = None  # (temp fd, sensor label) of the preferred ACPI zone, if any
 
-    # First try to get ACPI temp specifically
-    acpi_zones = [
-        ('/sys/class/thermal/thermal_zone0/temp', '/sys/class/thermal/thermal_zone0/type'),
-    ]
 
-    for temp_file, type_file in acpi_zones:
+def _discover_thermal_zones():
+    """Open every thermal zone's temp file once and read its type"""
+    zones = []
+    zone_dirs = glob.glob('/sys/class/thermal/thermal_zone*')
+    for zone_dir in sorted(zone_dirs, key=lambda d: int(d.rsplit('zone', 1)[1])):
         try:
-            # Check if this is the ACPI zone
-            with open(type_file, 'r') as f:
+            fd = os.open(os.path.join(zone_dir, 'temp'), os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            with open(os.path.join(zone_dir, 'type'), 'r') as f:
                 zone_type = f.read().strip()
+        except OSError:
+            zone_type = os.path.basename(zone_dir)[len('thermal_'):]
+        zones.append((fd, zone_type))
+    return zones
 
-            if 'acpi' in zone_type.lower():
-                with open(temp_file, 'r') as f:
-                    temp_millidegrees = int(f.read().strip())
-                    return temp_millidegrees / 1000.0, f"ACPI ({zone_type})"
-        except (FileNotFoundError, ValueError, PermissionError):
-            continue
 
-    # Fallback: read all thermal zones and use minimum (coldest = ambient)
-    temps = []
-    for i in range(5):  # Check up to 5 thermal zones
-        try:
-            temp_file = f'/sys/class/thermal/thermal_zone{i}/temp'
-            type_file = f'/sys/class/thermal/thermal_zone{i}/type'
+def _close_thermal_zones():
+    """Close cached zone fds so the next reading rediscovers the sensors"""
+    global _thermal_zones, _acpi_zone
+    for fd, _ in _thermal_zones or ():
+        os.close(fd)
+    _thermal_zones = None
+    _acpi_zone = None
+
 
-            with open(temp_file, 'r') as f:
-                temp_millidegrees = int(f.read().strip())
-                temp_celsius = temp_millidegrees / 1000.0
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+
+
+def open_file_watch(paths):
+    """
+    Watch paths for writes, replacement and deletion with inotify.
+
+    The containing directories are watched, so files that do not exist
+    yet (or are replaced by rename) are still seen.
+
+    Returns:
+        inotify fd, or None if inotify is not available
+    """
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+
+    mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE
+    for directory in {os.path.dirname(path) for path in paths}:
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def wait_for_file_change(watch_fd, paths, timeout):
+    """
+    Sleep for up to timeout seconds, waking early if one of paths changes.
+
+    Args:
+        watch_fd: fd from open_file_watch(), or None to just sleep
+        paths: Files of interest (events for other files are ignored)
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if a watched file changed, False on timeout
+    """
+    if watch_fd is None:
+        time.sleep(timeout)
+        return False
+
+    names = {os.fsencode(os.path.basename(path)) for path in paths}
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        ready, _, _ = select.select([watch_fd], [], [], remaining)
+        if not ready:
+            return False
+        try:
+            buf = os.read(watch_fd, 4096)
+        except BlockingIOError:
+            continue
 
+        # struct inotify_event: int wd; uint32 mask, cookie, len; char name[len]
+        changed = False
+        offset = 0
+        while offset < len(buf):
             try:
-                with open(type_file, 'r') as f:
-                    zone_type = f.read().strip()
-            except:
-                zone_type = f"zone{i}"
+                wd, mask, _, name_len = struct.unpack_from('iIII', buf, offset)
+            except struct.error:
+                # Truncated event: assume something changed
+                return True
+            name = buf[offset + 16:offset + 16 + name_len].rstrip(b'\0')
+            offset += 16 + name_len
+            if wd == -1 or mask & IN_Q_OVERFLOW:
+                # Events were dropped, so any watched file may have changed
+                return True
+            if name in names:
+                changed = True
+        if changed:
+            return True
 
-            temps.append((temp_celsius, zone_type))
-        except (FileNotFoundError, ValueError, PermissionError):
+
+def get_ambient_temp():
+    """Read ambient/ACPI temperature (not CPU temp - we want case temperature)"""
+    global _thermal_zones, _acpi_zone
+    if _thermal_zones is None:
+        _thermal_zones = _discover_thermal_zones()
+        # Prefer ACPI thermal zone (zone0 = acpitz on Zima board)
+        # This measures actual case ambient, not CPU self-heating
+        _acpi_zone = next(((fd, f"ACPI ({zone_type})") for fd, zone_type in _thermal_zones
+                           if 'acpi' in zone_type.lower()), None)
+
+    # Usual case: a single read of the ACPI zone chosen at discovery
+    if _acpi_zone is not None:
+        fd, sensor = _acpi_zone
+        try:
+            return int(os.pread(fd, 16, 0)) / 1000.0, sensor
+        except (OSError, ValueError):
+            pass
+
+    temps = []
+    for fd, zone_type in _thermal_zones:
+        try:
+            temps.append((int(os.pread(fd, 16, 0)) / 1000.0, zone_type))
+        except (OSError, ValueError):
             continue
 
     if temps:
-        # Return coldest reading (closest to ambient)
+        # Fallback: return coldest reading (closest to ambient)
         coldest = min(temps, key=lambda x: x[0])
         return coldest[0], coldest[1]
 
+    # Nothing readable: sensors may have changed, look again next time
+    _close_thermal_zones()
     return None, None
 
 
@@ -147,18 +308,46 @@ def heat_worker(worker_id, heating_flag, cpu_usage):
     except ImportError:
         pass
 
+    # Keep worker i on its own core, and run at nice 10 so the control loop
+    # and any real workload on the box always preempt the heater
+    try:
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[worker_id % len(cores)]})
+    except (AttributeError, OSError):
+        pass  # Not supported here or core offline: run unpinned
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+
     # Calculate work/sleep cycle for target CPU usage
     work_time = cpu_usage  # seconds of work
     sleep_time = 1 - cpu_usage  # seconds of sleep
 
+    if NUMPY_AVAILABLE:
+        # float32 matmul keeps the SIMD FMA units busy, which turns far more
+        # power into heat per busy second than interpreted Python arithmetic
+        A = np.random.rand(256, 256).astype(np.float32)
+        B = np.empty_like(A)
+
+        def burn():
+            np.dot(A, A, out=B)
+    else:
+        def burn():
+            sum(i * i for i in range(1000))
+
+    # Bursts per work period, re-fitted from each period's measured length,
+    # so the clock is read twice per cycle instead of after every burst
+    bursts = 1
+
     while True:
         if heating_flag.value:
             # Do CPU-intensive work
-            start = time.time()
-            result = 0
-            # Simple CPU-intensive calculation
-            while time.time() - start < work_time:
-                result += sum(i * i for i in range(1000))
+            start = time.monotonic()
+            for _ in range(bursts):
+                burn()
+            elapsed = time.monotonic() - start
+            bursts = max(1, round(bursts * work_time / elapsed)) if elapsed > 0 else bursts * 2
 
             # Sleep to achieve target CPU usage
             if sleep_time > 0:
@@ -178,6 +367,25 @@ def signal_handler(signum, frame):
 
 def main():
     """Main monitoring loop"""
+    # Setup signal handlers
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    # Determine number of CPU cores to use
+    total_cores = multiprocessing.cpu_count()
+    # Use all cores but they'll individually throttle to target usage
+    cores_to_use = total_cores
+
+    # Start worker processes before the log listener thread exists, so no
+    # child is forked while that thread holds the queue or handler locks
+    workers = []
+    for i in range(cores_to_use):
+        p = multiprocessing.Process(target=heat_worker, args=(i, heating_active, CPU_USAGE))
+        p.daemon = True
+        p.start()
+        workers.append(p)
+
+    setup_logging()
     log("=== Thermal Manager Starting ===")
     log(f"Python version: {sys.version}")
     log(f"Log file: {LOG_FILE}")
@@ -199,29 +407,21 @@ def main():
     else:
         log(f"Temperature sensor check OK: {test_temp}°C from {test_sensor}")
 
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
-    # Determine number of CPU cores to use
-    total_cores = multiprocessing.cpu_count()
-    # Use all cores but they'll individually throttle to target usage
-    cores_to_use = total_cores
     log(f"System has {total_cores} CPU cores, using {cores_to_use} for heating")
-
-    # Start worker processes
-    workers = []
-    for i in range(cores_to_use):
-        p = multiprocessing.Process(target=heat_worker, args=(i, heating_active, CPU_USAGE))
-        p.daemon = True
-        p.start()
-        workers.append(p)
-
     log(f"Started {len(workers)} heating worker processes")
 
+    # React to override/config changes as they happen instead of on the
+    # next CHECK_INTERVAL tick (falls back to plain polling without inotify)
+    watched_files = (OVERRIDE_FILE, CONFIG_FILE)
+    watch_fd = open_file_watch(watched_files)
+    if watch_fd is None:
+        log("inotify unavailable: override/config changes apply on the next check")
+
     # Main monitoring loop
     currently_heating = False
     sensor_name = None
+    override_state = None  # Cached (override_active, force_heating) while watched
+    ticks_since_override_read = 0
 
     try:
         while True:
@@ -247,8 +447,15 @@ def main():
 
             temp_f = (temp * 9/5) + 32  # Convert to Fahrenheit for logging
 
-            # Check for manual override first
-            override_active, force_heating = check_manual_override()
+            # Check for manual override first (re-read after a change when
+            # the file is watched, and every OVERRIDE_RECHECK_TICKS regardless
+            # in case an event was missed)
+            ticks_since_override_read += 1
+            if (override_state is None or watch_fd is None
+                    or ticks_since_override_read >= OVERRIDE_RECHECK_TICKS):
+                override_state = check_manual_override()
+                ticks_since_override_read = 0
+            override_active, force_heating = override_state
 
             if override_active:
                 # Manual override is active
@@ -283,7 +490,10 @@ def main():
                     status = "HEATING" if currently_heating else "IDLE"
                     log(f"{status}: Temp={temp:.1f}°C ({temp_f:.1f}°F) [{sensor_name}]")
 
-            time.sleep(CHECK_INTERVAL)
+            if wait_for_file_change(watch_fd, watched_files, CHECK_INTERVAL):
+                # Override or config changed: re-read both right away
+                override_state = None
+                last_config_check = 0
 
     except Exception as e:
         log(f"ERROR: {e}")
@@ -294,6 +504,8 @@ def main():
         heating_active.value = 0
         for p in workers:
             p.terminate()
+        if watch_fd is not None:
+            os.close(watch_fd)
         log("=== Thermal Manager Stopped ===")
 
 